@@ -1,16 +1,18 @@
-import json
 import time
 
-from operator import itemgetter
+from operator import attrgetter
 
 import requests
+from packaging.utils import canonicalize_name
 from packaging.version import Version, InvalidVersion
 
 from .exceptions import AnalyzerError, AnalyzerAPIError
+from .package import PackageRelease
 from .parser import RequirementParser
 from .utils.lists import split_to_chunks
 from .utils.logger import NoOperationLogger
 from .utils.dates import safe_isoformat_parse
+from .utils.jsons import json_dumps, json_loads
 from . import __pkgname__, __version__
 
 
@@ -36,6 +38,8 @@ class DependenciesAnalyzer(RequirementParser):
 
     def __init__(self, cachedir=None, api_pause=1, api_timeout=None, api_chunk=None,
                  logger=None, ignores=None):
+        super().__init__()
+
         self.cachedir = cachedir
         self.logger = logger or NoOperationLogger()
         # Amount of requirements to analyze by chunk
@@ -49,6 +53,9 @@ class DependenciesAnalyzer(RequirementParser):
         # ignore from analyze, dont know the state it will end in. It could be helpful
         # for bypassing some erroneous requirements without breaking the whole analyze.
         self.ignores = ignores or []
+        # Fetched package informations indexed on canonical package name so each
+        # package is only fetched once during analyzer lifetime
+        self.fetched_packages = {}
 
     def request_headers(self):
         """
@@ -164,7 +171,7 @@ class DependenciesAnalyzer(RequirementParser):
         # Return cache if it exists
         if cache_file and cache_file.exists():
             self.logger.debug("Loading data from cache")
-            return json.loads(cache_file.read_text())
+            return json_loads(cache_file.read_text())
 
         # Use given method name to request payload from API
         response = method(name)
@@ -178,7 +185,7 @@ class DependenciesAnalyzer(RequirementParser):
         # Build cache file if cache is enabled
         if self.cachedir:
             self.logger.debug("Writing cache: {}".format(cache_file))
-            cache_file.write_text(json.dumps(output, indent=4))
+            cache_file.write_text(json_dumps(output, indent=4))
 
         return output
 
@@ -200,12 +207,12 @@ class DependenciesAnalyzer(RequirementParser):
                 dict.
 
         Returns:
-            list: List of dictionnaries for all version, each one contain the ``number``
-            and ``published_at`` items.
+            list: List of ``PackageRelease`` for all version, each one contain the
+            ``number`` and ``published_at`` items as strings.
         """
         return [
-            {
-                "number": item["filename"].replace(
+            PackageRelease(
+                item["filename"].replace(
                     "-reupload",
                     ""
                 ).split(
@@ -214,8 +221,8 @@ class DependenciesAnalyzer(RequirementParser):
                     ".tar.gz",
                     ""
                 ),
-                "published_at": item["upload-time"],
-            }
+                item["upload-time"],
+            )
             for item in payload["files"]
             if item["filename"].endswith(".tar.gz")
         ]
@@ -266,29 +273,28 @@ class DependenciesAnalyzer(RequirementParser):
             data (dict): Dictionnary of package data as retrieved from API.
 
         Returns:
-            list: List of dictionnary for computed releases.
+            list: List of ``PackageRelease`` for computed releases.
         """
         versions = []
 
         # Rebuild the version list to patch some values in useful types
         for item in data["versions"]:
-            # Enforce real datetime
-            item["published_at"] = safe_isoformat_parse(item["published_at"])
-
             # Coerce original number to a Version object if possible
             try:
-                number = Version(item["number"])
+                number = Version(item.number)
             except InvalidVersion:
                 msg = (
                     "Ignored invalid version number '{version}' for package '{name}'"
                 )
-                self.logger.warning(msg.format(name=name, version=item["number"]))
+                self.logger.warning(msg.format(name=name, version=item.number))
                 continue
             else:
-                item["number"] = number
-                versions.append(item)
+                # Enforce real datetime
+                versions.append(
+                    PackageRelease(number, safe_isoformat_parse(item.published_at))
+                )
 
-        return sorted(versions, key=itemgetter("number"))
+        return sorted(versions, key=attrgetter("number"))
 
     def get_latest_specified_release(self, specifiers, releases):
         """
@@ -299,20 +305,20 @@ class DependenciesAnalyzer(RequirementParser):
         Arguments:
             specifiers (packaging.SpecifierSet): Version specifiers to match against
                 releases.
-            releases (list): List of dict for releases as built from
+            releases (list): List of ``PackageRelease`` as built from
                 ``DependenciesAnalyzer.compute_package_releases()``.
 
         Returns:
-            dict: Dictionnary of release data taken from given releases if it matched
+            PackageRelease: Release taken from given releases if it matched
             specifier. Else returns a null value.
         """
         indexed = {
-            str(item["number"]): item
+            str(item.number): item
             for item in releases
         }
         matched = sorted(
             specifiers.filter(
-                [str(item["number"]) for item in releases],
+                [str(item.number) for item in releases],
                 prereleases=False
             ),
         )
@@ -333,8 +339,8 @@ class DependenciesAnalyzer(RequirementParser):
             target (string or packaging.version.Version): The targeted version
                 to check against package released versions. If a string it will be
                 coerced to a ``Version`` object.
-            versions (list): List of dictionnaries (as computed from
-                ``build_package_informations()``) for all existing release versions.
+            versions (list): List of ``PackageRelease`` (as computed from
+                ``compute_package_releases()``) for all existing release versions.
 
         Returns:
             list: A list of tuples for all existing version higher
@@ -346,16 +352,34 @@ class DependenciesAnalyzer(RequirementParser):
             target = Version(target)
 
         return [
-            (str(item["number"]), item["published_at"])
+            (str(item.number), item.published_at)
             for item in versions
             if (
-                item["number"] > target and
-                item["number"].is_prerelease is False and
-                item["number"].is_postrelease is False and
-                item["number"].is_devrelease is False
+                item.number > target and
+                item.number.is_prerelease is False and
+                item.number.is_postrelease is False and
+                item.number.is_devrelease is False
             )
         ]
 
+    def compute_age(self, resolved_published, highest_published):
+        """
+        Compute the age of a resolved release against the highest release.
+
+        Arguments:
+            resolved_published (datetime.datetime): Publish date of resolved release.
+            highest_published (datetime.datetime): Publish date of highest release.
+
+        Returns:
+            tuple: Respectively the amount of days behind and the libyear value
+            (days behind in years, rounded to two decimals). A resolved release
+            published after the highest release (like a maintenance release) is
+            not behind.
+        """
+        days = max((highest_published - resolved_published).days, 0)
+
+        return days, round(days / 365.25, 2)
+
     def get_package_urls(self, data):
         """
         This should try to get the relevant URLs from package metadatas.
@@ -385,6 +409,81 @@ class DependenciesAnalyzer(RequirementParser):
             "repository": repository_url,
         }
 
+    def fetch_package(self, name):
+        """
+        Get the package informations required to analyze its requirements.
+
+        Informations are memorized so a package is requested (or loaded from cache)
+        only once for the analyzer lifetime. Only useful informations are kept from
+        package data to avoid to keep the whole API payloads in memory.
+
+        Arguments:
+            name (string): The package name to search for.
+
+        Returns:
+            dict: Package informations with items ``urls`` (as from
+            ``get_package_urls()``), ``highest_version`` and ``releases`` (as from
+            ``compute_package_releases()``).
+        """
+        key = canonicalize_name(name)
+
+        if key not in self.fetched_packages:
+            data = self.get_package_data(name)
+
+            self.fetched_packages[key] = {
+                "urls": self.get_package_urls(data),
+                "highest_version": Version(data["info"]["version"]),
+                # Once numbers have been coerced they can be used to reorder
+                # versions properly on number
+                "releases": self.compute_package_releases(name, data),
+            }
+
+        return self.fetched_packages[key]
+
+    def build_fetch_plan(self, requirements):
+        """
+        Build the list of packages to fetch for given requirements.
+
+        Arguments:
+            requirements (iterable): PackageRequirement objects.
+
+        Returns:
+            list: Unique package names to fetch, in order of first occurence. Only
+            requirements with status ``parsed`` are involved.
+        """
+        plan = {}
+
+        for requirement in requirements:
+            if requirement.status == "parsed":
+                plan.setdefault(canonicalize_name(requirement.name), requirement.name)
+
+        return list(plan.values())
+
+    def iter_chunks(self, items):
+        """
+        Split items in chunks with a pause between each chunk.
+
+        Chunks are lazily consumed so the pause is made before each chunk except the
+        first one.
+
+        Arguments:
+            items (iterable): Items to split.
+
+        Returns:
+            iterator: Iterator of chunks, each chunk is an iterable of items.
+        """
+        if self.api_chunk:
+            chunks = split_to_chunks(items, self.api_chunk)
+        else:
+            chunks = [items]
+
+        for i, chunk in enumerate(chunks, start=1):
+            if self.api_pause and i > 1:
+                self.logger.debug("Making pause of {} second(s)".format(self.api_pause))
+                time.sleep(self.api_pause)
+
+            yield chunk
+
     def build_package_informations(self, requirement):
         """
         Compute and set informations in a ``PackageRequirement`` object.
@@ -397,17 +496,13 @@ class DependenciesAnalyzer(RequirementParser):
             PackageRequirement: The package object.
         """
         if requirement.status == "parsed":
-            data = self.get_package_data(requirement.name)
-            urls = self.get_package_urls(data)
+            package = self.fetch_package(requirement.name)
+            versions = package["releases"]
 
             requirement.status = "analyzed"
-            requirement.pypi_url = urls["package"]
-            requirement.repository_url = urls["repository"]
-            requirement.highest_version = Version(data["info"]["version"])
-
-            # Once numbers have been coerced they can be used to reorder versions
-            # properly on number
-            versions = self.compute_package_releases(requirement.name, data)
+            requirement.pypi_url = package["urls"]["package"]
+            requirement.repository_url = package["urls"]["repository"]
+            requirement.highest_version = package["highest_version"]
 
             if requirement.specifier:
                 # Match the highest elligible release
@@ -416,28 +511,66 @@ class DependenciesAnalyzer(RequirementParser):
                     versions
                 )
                 if resolved:
-                    requirement.resolved_version = resolved["number"]
-                    requirement.resolved_published = resolved["published_at"]
+                    requirement.resolved_version = resolved.number
+                    requirement.resolved_published = resolved.published_at
 
             # Highest released version
-            requirement.highest_published = versions[-1]["published_at"]
+            requirement.highest_published = versions[-1].published_at
 
-            # Compute version lateness if a version has been given
+            # Compute version lateness and age if a version has been given
             if requirement.resolved_version:
                 requirement.lateness = self.compute_lateness(
                     requirement.resolved_version,
                     versions
                 )
+                requirement.days_behind, requirement.libyear = self.compute_age(
+                    requirement.resolved_published,
+                    requirement.highest_published,
+                )
 
         return requirement
 
+    def build_environment_matrix(self, requirement, environments):
+        """
+        Evaluate a requirement against many environments.
+
+        Requirement is expected to have been analyzed without environment, so its
+        package informations are shared and only marker evaluation differs for each
+        environment.
+
+        Arguments:
+            requirement (PackageRequirement): The requirement object to evaluate.
+            environments (dict): Environment variables dictionnaries indexed on a
+                name.
+
+        Returns:
+            dict: Dictionnaries with items ``status`` and ``lateness`` (the amount of
+            higher releases) indexed on environment names. Lateness is null if
+            requirement has no lateness or is rejected from marker evaluation.
+        """
+        matrix = {}
+
+        for name, environment in environments.items():
+            status = requirement.evaluate_environment(environment)
+            lateness = None
+            if status == "analyzed" and requirement.lateness is not None:
+                lateness = len(requirement.lateness)
+
+            matrix[name] = {"status": status, "lateness": lateness}
+
+        return matrix
+
     def inspect(self, requirements, environment=None, strict=False, basepath=None):
         """
         Inspect given requirement to get their informations.
 
+        Requirements are lazily parsed so the first ones can be processed before
+        the whole content has been read.
+
         Arguments:
-            requirements (string or Path): Either a Path object for a file to open or
-                directly requirements content as a string.
+            requirements (string or Path or file object): Either a Path object for a
+                file to open, an opened file object or directly requirements content
+                as a string.
 
         Keyword Arguments:
             environment (dict): Optionnal dictionnary of environment variables to use
@@ -452,24 +585,73 @@ class DependenciesAnalyzer(RequirementParser):
         Returns:
             iterator: Iterator of PackageRequirement objects for given requirements.
         """
-        parsed_requirements = self.parse_requirements(
+        parsed_requirements = self.iter_requirements(
             requirements,
             environment=environment,
             basepath=basepath,
         )
 
-        #
-        if self.api_chunk:
-            chunks = list(split_to_chunks(parsed_requirements, self.api_chunk))
-        else:
-            chunks = [parsed_requirements]
-
-        for i, chunk in enumerate(chunks, start=1):
+        for chunk in self.iter_chunks(parsed_requirements):
             for item in chunk:
                 pkginfos = self.build_package_informations(item)
                 if not strict or (strict and pkginfos.is_valid):
                     yield pkginfos
 
-            if self.api_pause and i < len(chunks):
-                self.logger.debug("Making pause of {} second(s)".format(self.api_pause))
-                time.sleep(self.api_pause)
+    def inspect_batch(self, sources, environment=None, strict=False):
+        """
+        Inspect requirements from many sources with a single fetch plan.
+
+        All sources are parsed first to build a deduplicated fetch plan, then every
+        package is fetched only once before requirements of each source are
+        computed.
+
+        Arguments:
+            sources (list): List of Path objects for requirement files to inspect.
+                Inclusion directives are resolved from each file parent directory.
+
+        Keyword Arguments:
+            environment (dict): Optionnal dictionnary of environment variables to use
+            with possible specifier marker resolution.
+            strict (boolean): If True only the valid requirements (see
+                ``dependency_comb.package.PackageRequirement.is_valid``) are returned.
+                Default is False, all requirements are returned and you need to check
+                their status yourself if needed.
+
+        Returns:
+            iterator: Iterator of tuples for each source with the source Path and the
+            list of its PackageRequirement objects.
+        """
+        parsed_sources = [
+            (
+                source,
+                self.parse_requirements(
+                    source,
+                    environment=environment,
+                    basepath=source.parent,
+                )
+            )
+            for source in sources
+        ]
+
+        plan = self.build_fetch_plan(
+            item
+            for source, requirements in parsed_sources
+            for item in requirements
+        )
+        self.logger.info(
+            "Fetch plan for {sources} source(s): {packages} package(s)".format(
+                sources=len(parsed_sources),
+                packages=len(plan),
+            )
+        )
+
+        for chunk in self.iter_chunks(plan):
+            for name in chunk:
+                self.fetch_package(name)
+
+        for source, requirements in parsed_sources:
+            yield source, [
+                pkginfos
+                for pkginfos in map(self.build_package_informations, requirements)
+                if not strict or pkginfos.is_valid
+            ]
@@ -6,11 +6,41 @@ import click
 
 from ..analyzer import DependenciesAnalyzer
 from ..exceptions import DependencyCombError
-from ..utils.jsons import ExtendedJsonEncoder
+from ..utils.jsons import json_dumps
 from ..utils.logger import NoOperationLogger
+from ..utils.msgpacks import msgpack, write_msgpack_manifest
 from .. import __pkgname__
 
 
+def write_ndjson(items, destination=None, fast=False):
+    """
+    Write items as NDJSON, each item is serialized and written as soon as it is
+    available.
+
+    Arguments:
+        items (iterable): Items to serialize.
+
+    Keyword Arguments:
+        destination (Path): File path destination where to write items. If not
+            given, items are sent to standard output.
+        fast (boolean): Serialize items with ``orjson`` if installed. See
+            ``dependency_comb.utils.jsons.json_dumps()``.
+    """
+    stream = destination.open("w") if destination else None
+
+    try:
+        for item in items:
+            line = json_dumps(item, fast=fast)
+            if stream:
+                stream.write(line + "\n")
+                stream.flush()
+            else:
+                click.echo(line)
+    finally:
+        if stream:
+            stream.close()
+
+
 @click.command()
 @click.argument(
     "source",
@@ -55,6 +85,37 @@ from .. import __pkgname__
         "Indentation level for JSON output. Default to 4 spaces."
     ),
 )
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    default=False,
+    help=(
+        "Output a JSON object per line for each requirement instead of a JSON list. "
+        "Each requirement is written as soon as it has been analyzed. Indentation "
+        "option is ignored in this mode."
+    ),
+)
+@click.option(
+    "--msgpack",
+    "msgpack_output",
+    is_flag=True,
+    default=False,
+    help=(
+        "Output a binary MessagePack manifest instead of JSON. It is smaller and "
+        "faster to parse by the 'format' command. Each requirement is written as soon "
+        "as it has been analyzed. This requires the 'msgpack' package to be installed."
+    ),
+)
+@click.option(
+    "--lateness-summary",
+    is_flag=True,
+    default=False,
+    help=(
+        "Store a lateness summary with the amount of missed releases, the oldest and "
+        "newest missed releases and the libyear value, instead of the list of all "
+        "missed releases. It makes a lot smaller manifests."
+    ),
+)
 @click.option(
     "--chunk",
     type=click.INT,
@@ -100,6 +161,26 @@ from .. import __pkgname__
         "is always considered valid)."
     ),
 )
+@click.option(
+    "--matrix",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    multiple=True,
+    metavar="FILEPATH",
+    help=(
+        "A JSON file for some environment variables to evaluate requirements against. "
+        "This option can be given multiple times, each requirement will have an "
+        "'environments' item with its status and lateness for each environment "
+        "indexed on the file name without extension, so file names must be "
+        "unique. Packages are still fetched only once. This option can not be used "
+        "with '--env' since requirements must be analyzed without environment."
+    ),
+)
 @click.pass_context
 def analyze_command(*args, **parameters):
     """
@@ -123,15 +204,42 @@ def analyze_command(*args, **parameters):
     """
     logger = logging.getLogger(__pkgname__)
 
-    source = parameters["source"].read()
+    # Source file object is given as is to be lazily read
+    source = parameters["source"]
     cachedir = parameters["cachedir"]
     destination = parameters["destination"]
     environment = json.loads(parameters["env"].read_text()) if parameters["env"] else {}
+    matrix = {}
+    for path in parameters["matrix"]:
+        if path.stem in matrix:
+            raise click.UsageError(
+                "Matrix environment name '{}' is given multiple times.".format(
+                    path.stem
+                )
+            )
+        matrix[path.stem] = json.loads(path.read_text())
     indent = parameters["indent"] or None
+    lateness_summary = parameters["lateness_summary"]
+    fast_json = (args[0].obj or {}).get("fast_json", False)
+    ndjson = parameters["ndjson"]
+    msgpack_output = parameters["msgpack_output"]
     api_chunk = parameters["chunk"] or None
     api_pause = parameters["pause"] or None
     api_timeout = parameters["timeout"] or None
 
+    if msgpack_output and ndjson:
+        raise click.UsageError("Options '--msgpack' and '--ndjson' are exclusive.")
+
+    # Requirements rejected from environment would be rejected for every matrix
+    # environment
+    if environment and matrix:
+        raise click.UsageError("Options '--env' and '--matrix' are exclusive.")
+
+    if msgpack_output and msgpack is None:
+        raise click.UsageError(
+            "Option '--msgpack' requires the 'msgpack' package to be installed."
+        )
+
     # Disable logger when writing results to standard output
     if not destination:
         logger = NoOperationLogger()
@@ -168,13 +276,34 @@ def analyze_command(*args, **parameters):
             strict=False,
             basepath=requirement_basepath,
         )
-        payload = [pkg.data() for pkg in packages]
+        items = (
+            dict(
+                pkg.json_data(lateness_summary=lateness_summary),
+                environments=analyzer.build_environment_matrix(pkg, matrix),
+            ) if matrix else pkg.json_data(lateness_summary=lateness_summary)
+            for pkg in packages
+        )
+
+        # Items are written while they are analyzed
+        if ndjson:
+            write_ndjson(items, destination=destination, fast=fast_json)
+            return
+
+        if msgpack_output:
+            if destination:
+                with destination.open("wb") as fp:
+                    write_msgpack_manifest(items, fp)
+            else:
+                write_msgpack_manifest(items, click.get_binary_stream("stdout"))
+            return
+
+        payload = list(items)
     except DependencyCombError as e:
         logger.critical(e)
         raise click.Abort()
 
     # Build output
-    output = json.dumps(payload, indent=indent, cls=ExtendedJsonEncoder)
+    output = json_dumps(payload, indent=indent, fast=fast_json)
 
     if not destination:
         click.echo(output)
@@ -0,0 +1,290 @@
+import json
+import logging
+from pathlib import Path
+
+import click
+
+from ..analyzer import DependenciesAnalyzer
+from ..exceptions import DependencyCombError
+from ..package import aggregate_age
+from ..utils.jsons import json_dumps
+from ..utils.logger import NoOperationLogger
+from .. import __pkgname__
+
+
+# Subdirectory of destination where to write the manifest of each source
+SOURCES_DIRNAME = "sources"
+
+
+def get_manifest_filename(source, used=None):
+    """
+    Build a manifest filename from a requirement file path.
+
+    Arguments:
+        source (Path): Requirement file path.
+
+    Keyword Arguments:
+        used (set): Already used filenames. If given, a filename which is already
+            used gets a numbered suffix like ``project-requirements-2.json`` and the
+            returned filename is added to the set.
+
+    Returns:
+        string: Filename made from the path parts without the anchor and the file
+        extension, like ``project-requirements.json`` for
+        ``project/requirements.txt``.
+    """
+    parts = source.with_suffix("").parts
+    if source.anchor:
+        parts = parts[1:]
+
+    name = "-".join(parts)
+    filename = name + ".json"
+
+    if used is not None:
+        # Different paths can be flattened to the same name like 'a-b/c.txt' and
+        # 'a/b-c.txt'
+        suffix = 1
+        while filename in used:
+            suffix += 1
+            filename = "{}-{}.json".format(name, suffix)
+
+        used.add(filename)
+
+    return filename
+
+
+@click.command()
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=True,
+        path_type=Path,
+    ),
+    metavar="SOURCES",
+)
+@click.option(
+    "--pattern",
+    default="*.txt",
+    metavar="STRING",
+    help=(
+        "Glob pattern used to find requirement files in given directory sources. "
+        "Recursive pattern like '**/requirements.txt' is allowed."
+    ),
+    show_default=True,
+)
+@click.option(
+    "--cachedir",
+    type=click.Path(
+        exists=False,
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    default=None,
+    metavar="DIRPATH",
+    help=(
+        "A directory where to look for API request cache. It is looked for cache file "
+        "per package and if any, avoid any request for a package details. There is not "
+        "any mechanic to invalidate or update cache except than to remove cache files. "
+        "The given directory path will be created automatically if it does not "
+        "exists yet."
+    ),
+)
+@click.option(
+    "--destination",
+    type=click.Path(
+        file_okay=False, dir_okay=True, resolve_path=False, path_type=Path,
+    ),
+    help=(
+        "Directory path destination where to write serialized JSON manifests. There "
+        "will be a manifest for each source in the 'sources' subdirectory, an "
+        "aggregated manifest "
+        "'manifest.json' for all sources and the age metrics (libyear and days "
+        "behind) summed for each source in 'ages.json'. If not given only the "
+        "aggregated manifest will be sent to standard output."
+    ),
+)
+@click.option(
+    "--indent",
+    type=click.INT,
+    default=4,
+    help=(
+        "Indentation level for JSON output. Default to 4 spaces."
+    ),
+)
+@click.option(
+    "--lateness-summary",
+    is_flag=True,
+    default=False,
+    help=(
+        "Store a lateness summary with the amount of missed releases, the oldest and "
+        "newest missed releases and the libyear value, instead of the list of all "
+        "missed releases. It makes a lot smaller manifests."
+    ),
+)
+@click.option(
+    "--chunk",
+    type=click.INT,
+    default=20,
+    help=(
+        "Amount of packages to fetch in a chunk. If zero, it means every "
+        "packages are fetched in a single job without no pause."
+    ),
+)
+@click.option(
+    "--pause",
+    type=click.INT,
+    default=1,
+    help=(
+        "The time in second to pause before each chunk. If zero "
+        "it means no pause. Prefer to disable chunk if you don't want any pause."
+    ),
+)
+@click.option(
+    "--timeout",
+    type=click.INT,
+    default=15,
+    help=(
+        "Timeout in seconds for API requests. Set it to 0 to disable timeout."
+    ),
+)
+@click.option(
+    "--env",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    default=None,
+    required=False,
+    metavar="FILEPATH",
+    help=(
+        "A JSON file for some environment variables to give to analyzer. This will be "
+        "used to resolve specifier markers. If analyzer does not receive any "
+        "environment variable all specifier markers are ignored (so its requirement "
+        "is always considered valid)."
+    ),
+)
+@click.pass_context
+def batch_command(*args, **parameters):
+    """
+    Analyze package releases from many requirements files at once and output
+    computed statistics as JSON.
+
+    All requirements are parsed first so every package is fetched only once even if
+    it is required from many sources.
+
+    Arguments:
+
+    \b
+    SOURCES
+        Pip requirements files to parse and analyze. A directory can be given
+        instead of a file, in this case the requirements files are searched
+        with the glob pattern from '--pattern'. For example:
+
+            dependency_comb batch project-a/requirements.txt projects/
+
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    cachedir = parameters["cachedir"]
+    destination = parameters["destination"]
+    environment = json.loads(parameters["env"].read_text()) if parameters["env"] else {}
+    indent = parameters["indent"] or None
+    lateness_summary = parameters["lateness_summary"]
+    fast_json = (args[0].obj or {}).get("fast_json", False)
+    api_chunk = parameters["chunk"] or None
+    api_pause = parameters["pause"] or None
+    api_timeout = parameters["timeout"] or None
+
+    # Disable logger when writing results to standard output
+    if not destination:
+        logger = NoOperationLogger()
+
+    # Expand directories to their requirement files
+    sources = []
+    for path in parameters["sources"]:
+        if path.is_dir():
+            sources.extend(sorted(
+                item for item in path.glob(parameters["pattern"]) if item.is_file()
+            ))
+        else:
+            sources.append(path)
+
+    logger.debug("Cache directory: {}".format(cachedir))
+
+    # Create cache directory if needed
+    if cachedir and not cachedir.exists():
+        cachedir.mkdir()
+
+    # Analyze requirements
+    try:
+        analyzer = DependenciesAnalyzer(
+            cachedir=cachedir,
+            api_chunk=api_chunk,
+            api_pause=api_pause,
+            api_timeout=api_timeout,
+            logger=logger,
+        )
+        payload = {
+            str(source): [
+                pkg.json_data(lateness_summary=lateness_summary) for pkg in packages
+            ]
+            for source, packages in analyzer.inspect_batch(
+                sources,
+                environment=environment,
+                strict=False,
+            )
+        }
+    except DependencyCombError as e:
+        logger.critical(e)
+        raise click.Abort()
+
+    # Build aggregated output
+    output = json_dumps(payload, indent=indent, fast=fast_json)
+
+    if not destination:
+        click.echo(output)
+    else:
+        sources_dir = destination / SOURCES_DIRNAME
+        if not sources_dir.exists():
+            sources_dir.mkdir(parents=True)
+
+        filenames = set()
+        for source, packages in payload.items():
+            filename = get_manifest_filename(Path(source))
+            unique = get_manifest_filename(Path(source), used=filenames)
+            if unique != filename:
+                logger.warning(
+                    "Manifest filename for '{}' is already used, renamed to: {}".format(
+                        source, unique
+                    )
+                )
+
+            manifest = sources_dir / unique
+            manifest.write_text(
+                json_dumps(packages, indent=indent, fast=fast_json)
+            )
+            logger.info("Analyze for '{}' written to: {}".format(source, manifest))
+
+        manifest = destination / "manifest.json"
+        manifest.write_text(output)
+        logger.info("Aggregated analyze written to: {}".format(manifest))
+
+        ages = destination / "ages.json"
+        ages.write_text(json_dumps(
+            {
+                source: aggregate_age(packages)
+                for source, packages in payload.items()
+            },
+            indent=indent,
+            fast=fast_json,
+        ))
+        logger.info("Ages written to: {}".format(ages))
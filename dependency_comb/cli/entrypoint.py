@@ -7,8 +7,11 @@ from ..utils.logger import init_logger
 
 from .version import version_command
 from .analyze import analyze_command
+from .batch import batch_command
 from .formatter import format_command
 from .report import report_command
+from .scan import scan_command
+from .stats import stats_command
 
 
 # Help alias on "-h" argument
@@ -31,8 +34,17 @@ APP_LOGGER_CONF = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", None)
         "level). Default to '4' (Info level)."
     )
 )
+@click.option(
+    "--fast-json",
+    is_flag=True,
+    default=False,
+    help=(
+        "Use 'orjson' if installed to serialize JSON manifests. It is faster but "
+        "the JSON is compact without spaces and indentation is always 2 spaces."
+    )
+)
 @click.pass_context
-def cli_frontend(ctx, verbose):
+def cli_frontend(ctx, verbose, fast_json):
     """
     dependency-comb commandline entrypoint.
     """
@@ -55,11 +67,15 @@ def cli_frontend(ctx, verbose):
     ctx.obj = {
         "verbosity": verbose,
         "logger": root_logger,
+        "fast_json": fast_json,
     }
 
 
 # Attach commands methods to the main grouper
 cli_frontend.add_command(version_command, name="version")
 cli_frontend.add_command(analyze_command, name="analyze")
+cli_frontend.add_command(batch_command, name="batch")
 cli_frontend.add_command(format_command, name="format")
 cli_frontend.add_command(report_command, name="report")
+cli_frontend.add_command(scan_command, name="scan")
+cli_frontend.add_command(stats_command, name="stats")
@@ -3,15 +3,17 @@ from pathlib import Path
 
 import click
 
+from ..exceptions import DependencyCombError
 from ..utils.logger import NoOperationLogger
 from ..formatting import DEFAULT_FORMAT, AVAILABLE_FORMATS, output_formatted_content
+from ..formatting.base import SORT_FIELDS
 from .. import __pkgname__
 
 
 @click.command()
 @click.argument(
     "source",
-    type=click.File(),
+    type=click.File("rb"),
     default="requirements.txt",
     metavar="SOURCE",
 )
@@ -33,6 +35,46 @@ from .. import __pkgname__
         "the JSON will be sent to standard output."
     ),
 )
+@click.option(
+    "--sort",
+    metavar="STRING",
+    type=click.Choice(SORT_FIELDS.keys()),
+    default=None,
+    help=(
+        "Sort analyzed requirements on a field. Lateness and days behind are sorted "
+        "from the highest value and name is sorted alphabetically. Default is to "
+        "keep the analyze order."
+    ),
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Only report this amount of analyzed requirements. Combined with '--sort' it "
+        "reports for example the most late requirements without to sort all of "
+        "them. If zero, every requirements are reported."
+    ),
+)
+@click.option(
+    "--min-lateness",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Only report analyzed requirements with at least this amount of missed "
+        "releases. If zero, every requirements are reported."
+    ),
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Split tables into pages of this amount of rows, each page is printed as "
+        "soon as it is rendered. This is only used by the 'rich' format and is "
+        "useful with large reports. If zero, tables are not split."
+    ),
+)
 @click.option(
     "--failures/--no-failures",
     is_flag=True,
@@ -47,7 +89,9 @@ def format_command(*args, **parameters):
     """
     Format an existing analyze.
 
-    Analyze is expected to be a valid JSON as outputted from 'analyze' command.
+    Analyze is expected to be a valid JSON as outputted from 'analyze' command, either
+    a JSON list or NDJSON, or a MessagePack manifest. Format is automatically
+    detected.
 
     Arguments:
 
@@ -60,22 +104,36 @@ def format_command(*args, **parameters):
     """
     logger = logging.getLogger(__pkgname__)
 
-    source = parameters["source"].read()
+    # Source file object is given as is to be incrementally parsed
+    source = parameters["source"]
     destination = parameters["destination"]
     format_name = parameters["format"]
     with_failures = parameters["failures"]
+    page_size = parameters["page_size"] or None
+    formatter_kwargs = {
+        "sort": parameters["sort"],
+        "top": parameters["top"] or None,
+        "min_lateness": parameters["min_lateness"] or None,
+    }
+    if format_name == "rich":
+        formatter_kwargs["page_size"] = page_size
 
     # Disable logger when writing results to standard output
     if not destination:
         logger = NoOperationLogger()
 
     # Output formatted content depending format and output method
-    output_formatted_content(
-        format_name,
-        source,
-        destination=destination,
-        with_failures=with_failures
-    )
+    try:
+        output_formatted_content(
+            format_name,
+            source,
+            destination=destination,
+            with_failures=with_failures,
+            formatter_kwargs=formatter_kwargs,
+        )
+    except DependencyCombError as e:
+        logger.critical(e)
+        raise click.Abort()
 
     if destination:
         logger.info("Formatted analyze to: {}".format(destination))
@@ -6,8 +6,10 @@ import click
 
 from ..analyzer import DependenciesAnalyzer
 from ..exceptions import DependencyCombError
-from ..formatting import DEFAULT_FORMAT, AVAILABLE_FORMATS, output_formatted_content
-from ..utils.jsons import ExtendedJsonEncoder
+from ..formatting import (
+    DEFAULT_FORMAT, AVAILABLE_FORMATS, BaseFormatter, output_formatted_content,
+)
+from ..formatting.base import SORT_FIELDS
 from .. import __pkgname__
 
 
@@ -41,8 +43,12 @@ from .. import __pkgname__
     "--format",
     metavar="STRING",
     type=click.Choice(AVAILABLE_FORMATS.keys()),
-    help="Format name.",
-    default=DEFAULT_FORMAT,
+    help=(
+        "Format name. This option can be given multiple times to output many formats "
+        "from the same analyze."
+    ),
+    multiple=True,
+    default=[DEFAULT_FORMAT],
     show_default=True,
 )
 @click.option(
@@ -50,9 +56,11 @@ from .. import __pkgname__
     type=click.Path(
         file_okay=True, dir_okay=False, resolve_path=False, path_type=Path,
     ),
+    multiple=True,
     help=(
-        "File path destination where to write serialized JSON manifest. If not given "
-        "the JSON will be sent to standard output."
+        "File path destination where to write formatted report. If not given "
+        "the report will be sent to standard output. When many formats are given, "
+        "there must be a destination for each format in the same order."
     ),
 )
 @click.option(
@@ -101,6 +109,46 @@ from .. import __pkgname__
     ),
     show_default=True,
 )
+@click.option(
+    "--sort",
+    metavar="STRING",
+    type=click.Choice(SORT_FIELDS.keys()),
+    default=None,
+    help=(
+        "Sort analyzed requirements on a field. Lateness and days behind are sorted "
+        "from the highest value and name is sorted alphabetically. Default is to "
+        "keep the analyze order."
+    ),
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Only report this amount of analyzed requirements. Combined with '--sort' it "
+        "reports for example the most late requirements without to sort all of "
+        "them. If zero, every requirements are reported."
+    ),
+)
+@click.option(
+    "--min-lateness",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Only report analyzed requirements with at least this amount of missed "
+        "releases. If zero, every requirements are reported."
+    ),
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Split tables into pages of this amount of rows, each page is printed as "
+        "soon as it is rendered. This is only used by the 'rich' format and is "
+        "useful with large reports. If zero, tables are not split."
+    ),
+)
 @click.option(
     "--failures/--no-failures",
     is_flag=True,
@@ -135,17 +183,25 @@ def report_command(*args, **parameters):
     """
     logger = logging.getLogger(__pkgname__)
 
-    source = parameters["source"].read()
+    # Source file object is given as is to be lazily read
+    source = parameters["source"]
     # Analyzer opts
     cachedir = parameters["cachedir"]
-    destination = parameters["destination"]
+    destinations = parameters["destination"]
     environment = json.loads(parameters["env"].read_text()) if parameters["env"] else {}
     api_chunk = parameters["chunk"] or None
     api_pause = parameters["pause"] or None
     api_timeout = parameters["timeout"] or None
     # Formatter opts
-    format_name = parameters["format"]
+    format_names = parameters["format"]
     with_failures = parameters["failures"]
+    page_size = parameters["page_size"] or None
+
+    if destinations and len(destinations) != len(format_names):
+        raise click.BadParameter(
+            "There must be a destination for each format.",
+            param_hint="'--destination'",
+        )
 
     # Find the requirement basepath
     if parameters["source"].name == "<stdin>":
@@ -173,24 +229,37 @@ def report_command(*args, **parameters):
             api_timeout=api_timeout,
             logger=logger,
         )
-        packages = analyzer.inspect(
+        packages = list(analyzer.inspect(
             source,
             environment=environment,
             strict=False,
             basepath=requirement_basepath,
-        )
-        payload = [pkg.data() for pkg in packages]
+        ))
     except DependencyCombError as e:
         logger.critical(e)
         raise click.Abort()
 
+    # Report model is built once from requirement objects (without any
+    # serialization) and shared for all formats
+    report = BaseFormatter(
+        sort=parameters["sort"],
+        top=parameters["top"] or None,
+        min_lateness=parameters["min_lateness"] or None,
+    ).build_report(packages)
+
     # Output formatted content depending format and output method
-    output_formatted_content(
-        format_name,
-        json.dumps(payload, cls=ExtendedJsonEncoder),
-        destination=destination,
-        with_failures=with_failures
-    )
-
-    if destination:
-        logger.info("Analyze report written to: {}".format(destination))
+    for i, format_name in enumerate(format_names):
+        destination = destinations[i] if destinations else None
+
+        output_formatted_content(
+            format_name,
+            report,
+            destination=destination,
+            with_failures=with_failures,
+            formatter_kwargs=(
+                {"page_size": page_size} if format_name == "rich" else None
+            ),
+        )
+
+        if destination:
+            logger.info("Analyze report written to: {}".format(destination))
@@ -0,0 +1,226 @@
+import json
+import logging
+from pathlib import Path
+
+import click
+
+from ..analyzer import DependenciesAnalyzer
+from ..exceptions import DependencyCombError
+from ..scanner import DEFAULT_IGNORES, DEFAULT_PATTERNS, RequirementScanner
+from ..utils.jsons import json_dumps
+from ..utils.logger import NoOperationLogger
+from .. import __pkgname__
+
+
+@click.command()
+@click.argument(
+    "basedir",
+    type=click.Path(
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    default=".",
+    metavar="BASEDIR",
+)
+@click.option(
+    "--pattern",
+    multiple=True,
+    metavar="STRING",
+    help=(
+        "Pattern to match requirement files. It is matched against file name and "
+        "against the file path relative to its parent directory. This option can be "
+        "given multiple times. Default patterns are: {}."
+    ).format(", ".join(DEFAULT_PATTERNS)),
+)
+@click.option(
+    "--ignore",
+    multiple=True,
+    metavar="STRING",
+    help=(
+        "Pattern for files or directories to ignore. It is matched against names and "
+        "against paths relative to base directory. This option can be given multiple "
+        "times and it will replace the default patterns: {}."
+    ).format(", ".join(DEFAULT_IGNORES)),
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Maximum amount of threads to walk directories. Default is automatically "
+        "determined."
+    ),
+)
+@click.option(
+    "--cachedir",
+    type=click.Path(
+        exists=False,
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    default=None,
+    metavar="DIRPATH",
+    help=(
+        "A directory where to look for API request cache. It is looked for cache file "
+        "per package and if any, avoid any request for a package details. There is not "
+        "any mechanic to invalidate or update cache except than to remove cache files. "
+        "The given directory path will be created automatically if it does not "
+        "exists yet."
+    ),
+)
+@click.option(
+    "--destination",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=False, path_type=Path,
+    ),
+    help=(
+        "File path destination where to write serialized JSON manifest. If not given "
+        "the JSON will be sent to standard output."
+    ),
+)
+@click.option(
+    "--indent",
+    type=click.INT,
+    default=4,
+    help=(
+        "Indentation level for JSON output. Default to 4 spaces."
+    ),
+)
+@click.option(
+    "--lateness-summary",
+    is_flag=True,
+    default=False,
+    help=(
+        "Store a lateness summary with the amount of missed releases, the oldest and "
+        "newest missed releases and the libyear value, instead of the list of all "
+        "missed releases. It makes a lot smaller manifests."
+    ),
+)
+@click.option(
+    "--chunk",
+    type=click.INT,
+    default=20,
+    help=(
+        "Amount of packages to fetch in a chunk. If zero, it means every "
+        "packages are fetched in a single job without no pause."
+    ),
+)
+@click.option(
+    "--pause",
+    type=click.INT,
+    default=1,
+    help=(
+        "The time in second to pause before each chunk. If zero "
+        "it means no pause. Prefer to disable chunk if you don't want any pause."
+    ),
+)
+@click.option(
+    "--timeout",
+    type=click.INT,
+    default=15,
+    help=(
+        "Timeout in seconds for API requests. Set it to 0 to disable timeout."
+    ),
+)
+@click.option(
+    "--env",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+        resolve_path=True,
+    ),
+    default=None,
+    required=False,
+    metavar="FILEPATH",
+    help=(
+        "A JSON file for some environment variables to give to analyzer. This will be "
+        "used to resolve specifier markers. If analyzer does not receive any "
+        "environment variable all specifier markers are ignored (so its requirement "
+        "is always considered valid)."
+    ),
+)
+@click.pass_context
+def scan_command(*args, **parameters):
+    """
+    Discover every requirements file from a directory tree and analyze them at once.
+
+    Inclusion directives are resolved from each requirements file directory. Output
+    is a JSON manifest where analyzes are indexed on requirements file paths relative
+    to the base directory.
+
+    Arguments:
+
+    \b
+    BASEDIR
+        Directory to scan. Default to the current working directory.
+
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    basedir = parameters["basedir"]
+    cachedir = parameters["cachedir"]
+    destination = parameters["destination"]
+    environment = json.loads(parameters["env"].read_text()) if parameters["env"] else {}
+    indent = parameters["indent"] or None
+    lateness_summary = parameters["lateness_summary"]
+    fast_json = (args[0].obj or {}).get("fast_json", False)
+    api_chunk = parameters["chunk"] or None
+    api_pause = parameters["pause"] or None
+    api_timeout = parameters["timeout"] or None
+
+    # Disable logger when writing results to standard output
+    if not destination:
+        logger = NoOperationLogger()
+
+    scanner = RequirementScanner(
+        patterns=list(parameters["pattern"]) or None,
+        ignores=list(parameters["ignore"]) or None,
+        workers=parameters["workers"],
+    )
+    sources = scanner.scan(basedir)
+    logger.info("Found {} requirements file(s)".format(len(sources)))
+
+    logger.debug("Cache directory: {}".format(cachedir))
+
+    # Create cache directory if needed
+    if cachedir and not cachedir.exists():
+        cachedir.mkdir()
+
+    # Analyze requirements
+    try:
+        analyzer = DependenciesAnalyzer(
+            cachedir=cachedir,
+            api_chunk=api_chunk,
+            api_pause=api_pause,
+            api_timeout=api_timeout,
+            logger=logger,
+        )
+        payload = {
+            source.relative_to(basedir).as_posix(): [
+                pkg.json_data(lateness_summary=lateness_summary) for pkg in packages
+            ]
+            for source, packages in analyzer.inspect_batch(
+                sources,
+                environment=environment,
+                strict=False,
+            )
+        }
+    except DependencyCombError as e:
+        logger.critical(e)
+        raise click.Abort()
+
+    # Build output
+    output = json_dumps(payload, indent=indent, fast=fast_json)
+
+    if not destination:
+        click.echo(output)
+    else:
+        destination.write_text(output)
+        logger.info("Scan analyze written to: {}".format(destination))
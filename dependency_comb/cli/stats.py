@@ -0,0 +1,119 @@
+import logging
+from pathlib import Path
+
+import click
+
+from ..exceptions import DependencyCombError
+from ..stats import DEFAULT_PERCENTILES, FleetStatistics
+from ..utils.jsons import json_dumps
+from ..utils.logger import NoOperationLogger
+from .. import __pkgname__
+
+
+@click.command()
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        path_type=Path,
+    ),
+    metavar="SOURCES",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=10,
+    help=(
+        "Amount of most outdated requirements to list, on lateness and on days "
+        "behind."
+    ),
+    show_default=True,
+)
+@click.option(
+    "--percentile",
+    type=click.FloatRange(min=0, max=100),
+    multiple=True,
+    help=(
+        "Percentile to compute for lateness and days behind, between 0 and 100. This "
+        "option can be given multiple times. Default percentiles are: {}."
+    ).format(", ".join([str(item) for item in DEFAULT_PERCENTILES])),
+)
+@click.option(
+    "--destination",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=False, path_type=Path,
+    ),
+    help=(
+        "File path destination where to write serialized JSON statistics. If not "
+        "given the JSON will be sent to standard output."
+    ),
+)
+@click.option(
+    "--indent",
+    type=click.INT,
+    default=4,
+    help=(
+        "Indentation level for JSON output. Default to 4 spaces."
+    ),
+)
+@click.pass_context
+def stats_command(*args, **parameters):
+    """
+    Compute statistics over many existing analyzes.
+
+    Statistics are percentiles of lateness and days behind, the most outdated
+    requirements and the distribution of resolved versions for each package. Only
+    correctly analyzed requirements are counted.
+
+    Arguments:
+
+    \b
+    SOURCES
+        Manifest file paths. Either an analyze from 'analyze' command (JSON list,
+        NDJSON or MessagePack) which is counted as a project, or an aggregated
+        manifest from 'batch' or 'scan' commands where each requirements file is
+        counted as a project. For example:
+
+            dependency_comb stats analyze.json batch/manifest.json
+
+    """
+    logger = logging.getLogger(__pkgname__)
+
+    destination = parameters["destination"]
+    indent = parameters["indent"] or None
+    fast_json = (args[0].obj or {}).get("fast_json", False)
+    percentiles = [
+        int(item) if item.is_integer() else item
+        for item in parameters["percentile"]
+    ]
+
+    # Disable logger when writing results to standard output
+    if not destination:
+        logger = NoOperationLogger()
+
+    statistics = FleetStatistics()
+
+    try:
+        for source in parameters["sources"]:
+            loaded = statistics.add_manifest(source)
+            logger.debug("Loaded {} requirement(s) from: {}".format(loaded, source))
+    except DependencyCombError as e:
+        logger.critical(e)
+        raise click.Abort()
+
+    # Build output
+    output = json_dumps(
+        statistics.summary(percentiles=percentiles or None, top=parameters["top"]),
+        indent=indent,
+        fast=fast_json,
+    )
+
+    if not destination:
+        click.echo(output)
+    else:
+        destination.write_text(output)
+        logger.info("Statistics written to: {}".format(destination))
@@ -46,3 +46,10 @@ class RequirementParserError(DependencyCombError):
     When parser encounter invalid syntax on given content.
     """
     pass
+
+
+class ManifestError(DependencyCombError):
+    """
+    When a manifest can not be read or written.
+    """
+    pass
@@ -1,4 +1,5 @@
 from .base import BaseFormatter
+from .model import ReportModel
 from .csv import CSVFormatter
 from .json_format import JSONFormatter
 from .rst import RestructuredTextFormatter
@@ -14,6 +15,7 @@ __all__ = [
     "BaseFormatter",
     "CSVFormatter",
     "JSONFormatter",
+    "ReportModel",
     "RichFormatter",
     "RestructuredTextFormatter",
 ]
@@ -32,9 +34,13 @@ if RichFormatter:
 
 
 def output_formatted_content(name, content, printer=None, printer_kwargs=None,
-                             destination=None, with_failures=True):
+                             destination=None, with_failures=True,
+                             formatter_kwargs=None):
     """
     Helper to output formatted content either with a printer or written to a file.
+
+    Formatter specific options like ``page_size`` for ``RichFormatter`` can be given
+    with ``formatter_kwargs``.
     """
     if name not in AVAILABLE_FORMATS:
         raise ValueError("Given formatter name is unknowed: {}".format(name))
@@ -42,6 +48,7 @@ def output_formatted_content(name, content, printer=None, printer_kwargs=None,
     formatter = AVAILABLE_FORMATS[name](
         printer=printer,
         printer_kwargs=printer_kwargs,
+        **(formatter_kwargs or {})
     )
 
     if not destination:
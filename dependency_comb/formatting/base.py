@@ -1,14 +1,29 @@
 import datetime
-import json
+import heapq
+import io
 
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from textwrap import TextWrapper
 
 import click
 import humanize
 
-from ..package import PackageRequirement
+from ..package import PackageRequirement, get_days_behind, get_lateness_count
 from ..utils.dates import safe_isoformat_parse
+from ..utils.jsons import iter_json_items, json_dumps
+from ..utils.msgpacks import iter_manifest_items
+from .model import ReportModel
+
+
+# Available sort fields for analyzed requirements, with their order direction where
+# True means from the highest value
+SORT_FIELDS = {
+    "name": False,
+    "lateness": True,
+    "days_behind": True,
+}
 
 
 class BaseFormatter:
@@ -26,11 +41,36 @@ class BaseFormatter:
             date.
         printer (callable):
         printer_kwargs (dict):
+        sort (string): Field name from ``SORT_FIELDS`` to sort analyzed
+            requirements on. Default to None to keep the analyze order.
+        top (integer): Only keep this amount of analyzed requirements. With a sort
+            they are selected with a heap so the whole analyze is never sorted, else
+            the first ones are kept. Default to None to keep every requirements.
+        min_lateness (integer): Only keep analyzed requirements with at least this
+            amount of missed releases. Default to None to keep every requirements.
+
+    Attributes:
+        date_cache (dict): Memoized parsed dates indexed on their ISO string.
+        delta_cache (dict): Memoized humanized deltas indexed on a tuple of release
+            date and current date.
     """
-    def __init__(self, now_date=None, printer=None, printer_kwargs=None):
+    def __init__(self, now_date=None, printer=None, printer_kwargs=None, sort=None,
+                 top=None, min_lateness=None):
+        if sort and sort not in SORT_FIELDS:
+            raise ValueError("Given sort field is unknowed: {}".format(sort))
+
+        if top is not None and top < 0:
+            raise ValueError("Given top can not be negative: {}".format(top))
+
         self.now_date = now_date or datetime.datetime.now()
         self.printer = printer
         self.printer_kwargs = printer_kwargs
+        self.sort = sort
+        self.top = top
+        self.min_lateness = min_lateness
+        self.wrapper = TextWrapper(width=40, max_lines=2, placeholder="")
+        self.date_cache = {}
+        self.delta_cache = {}
 
     def get_printer_function(self):
         return self.printer or click.echo
@@ -54,7 +94,52 @@ class BaseFormatter:
         serializes content with JSON because internally the content is a list but this
         is rarely the case with other formatters.
         """
-        return json.dumps(content)
+        return json_dumps(content)
+
+    def parse_date(self, value):
+        """
+        Get a datetime from a requirement date value.
+
+        Parsed dates are memoized since the same release dates are commonly repeated
+        through many requirements.
+
+        Arguments:
+            value (string or datetime): Either a datetime object (when formatting
+                requirements objects) or a string in ISO format (when formatting a
+                JSON analyze).
+
+        Returns:
+            datetime: The datetime object.
+        """
+        if isinstance(value, datetime.datetime):
+            return value
+
+        if value not in self.date_cache:
+            self.date_cache[value] = safe_isoformat_parse(value)
+
+        return self.date_cache[value]
+
+    def humanize_delta(self, value):
+        """
+        Get the humanized delta between a requirement date value and current date.
+
+        Humanized deltas are memoized on the date value and the current date.
+
+        Arguments:
+            value (string or datetime): Date value, see
+                ``BaseFormatter.parse_date()`` for details.
+
+        Returns:
+            string: The humanized delta like ``2 months``.
+        """
+        key = (value, self.now_date)
+
+        if key not in self.delta_cache:
+            self.delta_cache[key] = humanize.naturaldelta(
+                self.now_date - self.parse_date(value)
+            )
+
+        return self.delta_cache[key]
 
     def get_required_release(self, item):
         """
@@ -72,140 +157,334 @@ class BaseFormatter:
         if not item["resolved_version"]:
             return "Latest", None
 
-        resolved_age = humanize.naturaldelta(
-            self.now_date - safe_isoformat_parse(item["resolved_published"])
+        resolved_age = self.humanize_delta(item["resolved_published"])
+        return str(item["resolved_version"]), resolved_age.capitalize()
+
+    def build_analyzed_row(self, item, key):
+        """
+        Build the row for a properly analyzed requirement.
+
+        Arguments:
+            item (dict): The requirement dictionnary.
+            key (integer): Row position in table.
+
+        Returns:
+            dict: Row data.
+        """
+        lateness = get_lateness_count(item["lateness"]) or "-"
+
+        label, age = self.get_required_release(item)
+        if age:
+            resolved_version = "{} - {} ago".format(label, age)
+        else:
+            resolved_version = label
+
+        # Compute latest release label including humanized delta from current to
+        # latest date
+        latest_activity = self.humanize_delta(item["highest_published"])
+        latest_release = "{} - {} ago".format(
+            item["highest_version"],
+            latest_activity.capitalize(),
         )
-        return item["resolved_version"], resolved_age.capitalize()
 
-    def build_analyzed_table(self, items):
+        return {
+            "key": key,
+            "name": item["name"],
+            "lateness": lateness,
+            "resolved_version": resolved_version,
+            "latest_release": latest_release,
+            "latest_activity": latest_activity,
+            "release_label": label,
+            "release_age": age,
+        }
+
+    def build_error_row(self, item, key):
         """
-        Build the information table for properly analyzed requirements.
+        Build the row for a failed requirement analyze.
+
+        Arguments:
+            item (dict): The requirement dictionnary.
+            key (integer): Row position in table.
+
+        Returns:
+            dict: Row data.
+        """
+        status = item["status"]
+
+        resume = PackageRequirement.STATUS_LABELS.get(
+            status,
+            PackageRequirement.STATUS_LABELS["unknown"]
+        )
+        if status == "invalid":
+            resume += ": {}".format(item["parsing_error"])
+
+        return {
+            "key": key,
+            "source": self.wrapper.fill(item["source"]),
+            "status": status,
+            "resume": self.wrapper.fill(resume),
+        }
+
+    def get_sort_value(self, item):
+        """
+        Get the value to sort an analyzed requirement on.
+
+        Arguments:
+            item (dict): The requirement dictionnary.
+
+        Returns:
+            object: Value for the sort field, lateness is zero when there is no
+            lateness and name is compared case insensitively.
+        """
+        if self.sort == "lateness":
+            return get_lateness_count(item["lateness"]) or 0
+        elif self.sort == "days_behind":
+            return get_days_behind(item)
+
+        return item["name"].lower()
+
+    def is_selected(self, item):
+        """
+        Check if an analyzed requirement pass the lateness filter.
+
+        Arguments:
+            item (dict): The requirement dictionnary.
+
+        Returns:
+            boolean: True if requirement has enough missed releases or if there is
+            no lateness filter.
+        """
+        if not self.min_lateness:
+            return True
+
+        return (get_lateness_count(item["lateness"]) or 0) >= self.min_lateness
+
+    def select_analyzed(self, items):
+        """
+        Apply sort and top options to analyzed requirements.
+
+        With a top and a sort, requirements are selected with a heap so only the top
+        amount of requirements is kept in memory. Requirements with the same sort
+        value keep their analyze order.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. Only
-                items with status ``analyzed`` are processed here and all other status
-                items are ignored.
+            items (iterable): Analyzed requirement dictionnaries.
 
         Returns:
-            list: A list of dictionnaries for each processed items.
+            iterable: Selected requirements.
         """
-        analyzed_items = [v for v in items if v["status"] == "analyzed"]
+        if self.sort:
+            reverse = SORT_FIELDS[self.sort]
+
+            if self.top:
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                return select(self.top, items, key=self.get_sort_value)
 
-        rows = []
+            return sorted(items, key=self.get_sort_value, reverse=reverse)
+
+        if self.top:
+            items = iter(items)
+            selected = list(islice(items, self.top))
+            # Remaining items are still consumed since they may be followed by
+            # failures
+            deque(items, maxlen=0)
+            return selected
+
+        return items
+
+    def iter_report_items(self, content, report):
+        """
+        Iterate over analyzed requirements which pass the lateness filter while
+        failure rows are added to the report.
 
-        for i, item in enumerate(analyzed_items, start=1):
-            lateness = len(item["lateness"]) if item["lateness"] else "-"
+        Arguments:
+            content (Path or string or file object or iterable): JSON content as
+                built from Analyzer, see ``BaseFormatter.iter_items()`` for details.
+            report (ReportModel): Report model where to add failure rows.
 
-            label, age = self.get_required_release(item)
-            if age:
-                resolved_version = "{} - {} ago".format(label, age)
+        Returns:
+            iterator: Iterator of analyzed requirement dictionnaries.
+        """
+        for item in self.iter_items(content):
+            if item["status"] == "analyzed":
+                if self.is_selected(item):
+                    yield item
             else:
-                resolved_version = label
+                report.failures.append(
+                    self.build_error_row(item, len(report.failures) + 1)
+                )
 
-            # Compute latest release label including humanized delta from current to
-            # latest date
-            latest_activity = humanize.naturaldelta(
-                self.now_date - safe_isoformat_parse(item["highest_published"])
-            )
-            latest_release = "{} - {} ago".format(
-                item["highest_version"],
-                latest_activity.capitalize(),
-            )
+    def build_report(self, content):
+        """
+        Build the report model from given content.
+
+        Requirements are split on their status in a single pass. Sort, top and
+        lateness filter options are applied on analyzed requirements before their
+        rows are built so rows are only built for the selected ones. Failures are
+        never filtered.
+
+        Arguments:
+            content (Path or string or file object or iterable): JSON content as
+                built from Analyzer, see ``BaseFormatter.iter_items()`` for details.
+                It can also be a ``ReportModel`` object which is then returned as is.
+
+        Returns:
+            ReportModel: The report model with analyzed and failures rows.
+        """
+        if isinstance(content, ReportModel):
+            return content
+
+        report = ReportModel()
+
+        selected = self.select_analyzed(self.iter_report_items(content, report))
+        report.analyzed = [
+            self.build_analyzed_row(item, i)
+            for i, item in enumerate(selected, start=1)
+        ]
+
+        return report
 
-            # Append column data to the requirement row
-            rows.append({
-                "key": i,
-                "name": item["name"],
-                "lateness": lateness,
-                "resolved_version": resolved_version,
-                "latest_release": latest_release,
-                "latest_activity": latest_activity,
-                "release_label": label,
-                "release_age": age,
-            })
+    def render_analyzed(self, rows):
+        """
+        Render the information table for properly analyzed requirements.
+
+        Formatters should commonly override it since the default implementation just
+        returns the rows.
+
+        Arguments:
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_analyzed_row()``.
 
+        Returns:
+            list: The given rows.
+        """
         return rows
 
-    def build_errors_table(self, items):
+    def render_errors(self, rows):
         """
-        Build the information table for failed requirements analyze.
+        Render the information table for failed requirements analyze.
+
+        Formatters should commonly override it since the default implementation just
+        returns the rows.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. All items
-                are processed except the ones with status ``analyzed``.
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_error_row()``.
 
         Returns:
-            list: A list of dictionnaries for each processed items.
+            list: The given rows.
+        """
+        return rows
+
+    def build_analyzed_table(self, items):
         """
-        ignored_items = [v for v in items if v["status"] != "analyzed"]
+        Build the information table for properly analyzed requirements.
 
-        rows = []
-        wrapper = TextWrapper(width=40, max_lines=2, placeholder="")
-        default_label = PackageRequirement.STATUS_LABELS["unknown"]
+        This is a shortcut to render the analyzed rows from
+        ``BaseFormatter.build_report()``.
+
+        Arguments:
+            items (iterable): Requirements as returned from Analyzer, see
+                ``BaseFormatter.iter_items()`` for supported content. Only items
+                with status ``analyzed`` are rendered.
 
-        for i, item in enumerate(ignored_items, start=1):
-            status = item["status"]
+        Returns:
+            object: The rendered table from ``BaseFormatter.render_analyzed()``.
+        """
+        return self.render_analyzed(self.build_report(items).analyzed)
 
-            resume = PackageRequirement.STATUS_LABELS.get(status, default_label)
-            if status == "invalid":
-                resume += ": {}".format(item["parsing_error"])
+    def build_errors_table(self, items):
+        """
+        Build the information table for failed requirements analyze.
 
-            rows.append({
-                "key": i,
-                "source": wrapper.fill(item["source"]),
-                "status": status,
-                "resume": wrapper.fill(resume),
-            })
+        This is a shortcut to render the failure rows from
+        ``BaseFormatter.build_report()``.
 
-        return rows
+        Arguments:
+            items (iterable): Requirements as returned from Analyzer, see
+                ``BaseFormatter.iter_items()`` for supported content. All items are
+                rendered except the ones with status ``analyzed``.
 
-    def output(self, content):
+        Returns:
+            object: The rendered table from ``BaseFormatter.render_errors()``.
         """
-        Parse given content and returns it as a Python list.
+        return self.render_errors(self.build_report(items).failures)
+
+    def iter_items(self, content):
+        """
+        Lazily parse given content to iterate over its requirements.
 
         Arguments:
-            content (Path or string or list): JSON content as built from Analyzer. It
-                can be either:
+            content (Path or string or file object or iterable): JSON content as
+                built from Analyzer. It can be either:
 
                 * A string assumed as JSON to be parsed;
-                * A file Path that will be readed and parsed as JSON;
-                * A list that is expected to be directly the list of (dict) analyzed
-                  requirements, no parsing will be involved.
+                * Bytes or a file Path or an opened binary file object to be parsed
+                  either as a MessagePack manifest or JSON, the format is detected
+                  from manifest magic bytes;
+                * An opened text file object that will be parsed as JSON;
+                * An iterable (like a list) of (dict) analyzed requirements or
+                  directly ``PackageRequirement`` objects from Analyzer, no parsing
+                  will be involved and values keep their native types.
+
+                JSON can be either a list of requirements (as from ``analyze``
+                command) or NDJSON (as from ``analyze`` command with ``--ndjson``),
+                it is incrementally parsed so the whole content is never loaded at
+                once.
 
         Returns:
-            list: The list of all (dict) requirements from given content.
+            iterator: Iterator of (dict) requirements from given content.
         """
-        if isinstance(content, list):
-            return content
-
         if isinstance(content, Path):
-            content = content.read_text()
+            with content.open("rb") as fp:
+                yield from iter_manifest_items(fp)
+        elif isinstance(content, bytes):
+            yield from iter_manifest_items(io.BytesIO(content))
+        elif hasattr(content, "read") and isinstance(content.read(0), bytes):
+            yield from iter_manifest_items(content)
+        elif isinstance(content, str) or hasattr(content, "read"):
+            yield from iter_json_items(content)
+        else:
+            for item in content:
+                if isinstance(item, PackageRequirement):
+                    yield item.data()
+                else:
+                    yield item
 
-        data = json.loads(content)
+    def output(self, content):
+        """
+        Parse given content and returns it as a Python list.
+
+        Arguments:
+            content (Path or string or file object or iterable): JSON content as
+                built from Analyzer, see ``BaseFormatter.iter_items()`` for details.
 
-        return data
+        Returns:
+            list: The list of all (dict) requirements from given content.
+        """
+        return list(self.iter_items(content))
 
     def print(self, content, with_failures=True):
         """
         Print out the analyzed and possibly failures
         """
-        data = self.output(content)
+        report = self.build_report(content)
 
-        self.printer_call(self.build_analyzed_table(data))
+        self.printer_call(self.render_analyzed(report.analyzed))
 
         if with_failures:
-            self.printer_call(self.build_errors_table(data))
+            self.printer_call(self.render_errors(report.failures))
 
     def write(self, content, destination, with_failures=True):
         """
         Write the analyzed and possibly failures into destination file.
         """
-        data = self.output(content)
+        report = self.build_report(content)
 
-        output = self.build_analyzed_table(data)
+        output = self.render_analyzed(report.analyzed)
 
         if with_failures:
-            output += self.build_errors_table(data)
+            output += self.render_errors(report.failures)
 
         # Write merged built lists as JSON
         destination.write_text(self.serialize_output(output))
@@ -1,36 +1,43 @@
 import csv
 from io import StringIO
 
+import click
 
 from .base import BaseStringFormatter
+from .model import ReportModel
 
 
 class CSVFormatter(BaseStringFormatter):
     """
     Format a requirements analyze to a report made with Rich library.
+
+    When writing to a file or printing with the default printer, rows are directly
+    written to the file object without to build the whole CSV string.
+
+    Also without sort and top options, analyzed rows are written while the analyze
+    is parsed and only the failure rows are kept in memory. Else the memory is
+    proportional to the amount of rows since the report is built first.
     """
-    def build_analyzed_table(self, items):
+    def write_table(self, fp, rows):
         """
-        Build the information table for properly analyzed requirements.
+        Write rows as CSV into a file object.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. All
-                given items should have a status "analyzed" else it would lead to
-                unexpected results or even errors.
+            fp (file object): Opened file object where to write CSV.
+            rows (iterable): Row dictionnaries, they are written as soon as they
+                are iterated. If empty nothing is written.
 
         Returns:
-            string:
+            file object: The given file object.
         """
-        payload = StringIO()
-
-        data = super().build_analyzed_table(items)
-
-        if not data:
-            return
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return fp
 
         table = csv.DictWriter(
-            payload,
-            fieldnames=data[0].keys(),
+            fp,
+            fieldnames=first.keys(),
             delimiter=',',
             quotechar='"',
             quoting=csv.QUOTE_ALL,
@@ -38,41 +45,108 @@ class CSVFormatter(BaseStringFormatter):
         )
 
         table.writeheader()
-        for item in data:
+        table.writerow(first)
+        for item in rows:
             table.writerow(item)
 
-        return payload.getvalue()
+        return fp
 
-    def build_errors_table(self, items):
+    def stream_report(self, content):
         """
-        Build the information table for failed requirements analyze.
+        Get the report with its analyzed rows possibly lazily built.
+
+        Analyzed rows can only be built lazily when there is no sort or top
+        options since they need every rows, and when content is not already a
+        report model.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. Given
-                items could have any status despite not very useful for properly
-                analyzed items.
+            content (Path or string or file object or iterable): JSON content as
+                built from Analyzer, see ``BaseFormatter.iter_items()`` for details.
+                It can also be a ``ReportModel`` object.
 
         Returns:
-            string:
+            tuple: The report model and its analyzed rows. When rows are lazily
+            built, they are an iterator which fills the report failures while it
+            is consumed, so failures are only complete once rows are all consumed.
         """
-        payload = StringIO()
+        if isinstance(content, ReportModel) or self.sort or self.top:
+            report = self.build_report(content)
+            return report, report.analyzed
+
+        report = ReportModel()
+        rows = (
+            self.build_analyzed_row(item, i)
+            for i, item in enumerate(
+                self.iter_report_items(content, report),
+                start=1,
+            )
+        )
+
+        return report, rows
 
-        data = super().build_errors_table(items)
+    def render_analyzed(self, rows):
+        """
+        Render the information table for properly analyzed requirements.
+
+        Arguments:
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_analyzed_row()``.
 
-        if not data:
+        Returns:
+            string: CSV built from given rows.
+        """
+        if not rows:
             return
 
-        table = csv.DictWriter(
-            payload,
-            fieldnames=data[0].keys(),
-            delimiter=',',
-            quotechar='"',
-            quoting=csv.QUOTE_ALL,
-            dialect=csv.unix_dialect,
-        )
+        return self.write_table(StringIO(), rows).getvalue()
 
-        table.writeheader()
-        for item in data:
-            table.writerow(item)
+    def render_errors(self, rows):
+        """
+        Render the information table for failed requirements analyze.
+
+        Arguments:
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_error_row()``.
+
+        Returns:
+            string: CSV built from given rows.
+        """
+        if not rows:
+            return
+
+        return self.write_table(StringIO(), rows).getvalue()
+
+    def print(self, content, with_failures=True):
+        """
+        Print out the analyzed and possibly failures.
+
+        With the default printer, rows are directly written to the standard output
+        with the same final newline than ``click.echo()``. A custom printer or
+        printer arguments fallback to the common print behavior.
+        """
+        if self.printer or self.printer_kwargs:
+            return super().print(content, with_failures=with_failures)
+
+        report, rows = self.stream_report(content)
+        stream = click.get_text_stream("stdout")
+
+        self.write_table(stream, rows).write("\n")
+
+        if with_failures:
+            self.write_table(stream, report.failures).write("\n")
+
+        stream.flush()
+
+    def write(self, content, destination, with_failures=True):
+        """
+        Write the analyzed and possibly failures into destination file.
+        """
+        report, rows = self.stream_report(content)
+
+        with destination.open("w") as fp:
+            self.write_table(fp, rows)
+
+            if with_failures:
+                self.write_table(fp, report.failures)
 
-        return payload.getvalue()
+        return destination
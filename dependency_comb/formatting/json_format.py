@@ -1,5 +1,4 @@
-import json
-
+from ..utils.jsons import json_dumps
 from .base import BaseFormatter
 
 
@@ -12,14 +11,14 @@ class JSONFormatter(BaseFormatter):
         """
         Build dictionnary of analyzed and possibles failures
         """
-        data = self.output(content)
+        report = self.build_report(content)
 
         payload = {}
 
-        payload["analyzed"] = self.build_analyzed_table(data)
+        payload["analyzed"] = self.render_analyzed(report.analyzed)
 
         if with_failures:
-            payload["failures"] = self.build_errors_table(data)
+            payload["failures"] = self.render_errors(report.failures)
 
         return payload
 
@@ -27,12 +26,12 @@ class JSONFormatter(BaseFormatter):
         """
         Print out the analyzed and possibly failures
         """
-        self.printer_call(json.dumps(self.build(content), indent=4))
+        self.printer_call(json_dumps(self.build(content), indent=4))
 
     def write(self, content, destination, with_failures=True):
         """
         Write the analyzed and possibly failures into destination file.
         """
-        destination.write_text(json.dumps(self.build(content)))
+        destination.write_text(json_dumps(self.build(content)))
 
         return destination
@@ -0,0 +1,21 @@
+class ReportModel:
+    """
+    Computed rows of a report that formatters render.
+
+    A report model is built once from an analyze (see
+    ``BaseFormatter.build_report()``) and can be given to many formatters so the
+    rows are not computed again for each format.
+
+    Arguments:
+        analyzed (list): List of row dictionnaries for analyzed requirements.
+        failures (list): List of row dictionnaries for failed requirements.
+    """
+    def __init__(self, analyzed=None, failures=None):
+        self.analyzed = analyzed or []
+        self.failures = failures or []
+
+    def __repr__(self):
+        return "<ReportModel: {analyzed} analyzed, {failures} failures>".format(
+            analyzed=len(self.analyzed),
+            failures=len(self.failures),
+        )
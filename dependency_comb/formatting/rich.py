@@ -3,7 +3,6 @@ from rich.console import Console
 from rich.padding import Padding
 from rich.panel import Panel
 from rich.table import Table
-from rich.console import Group
 
 from .base import BaseStringFormatter
 
@@ -11,18 +10,26 @@ from .base import BaseStringFormatter
 class RichFormatter(BaseStringFormatter):
     """
     Format a requirements analyze to a report made with Rich library.
+
+    Keyword Arguments:
+        page_size (integer): If given, tables are split into pages of this amount of
+            rows and each page is printed as soon as it is rendered. It keeps render
+            time linear for large reports. Default to None so tables are not split.
     """
-    def build_analyzed_table(self, items):
+    def __init__(self, *args, page_size=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_size = page_size
+
+    def render_analyzed(self, rows):
         """
-        Build the information table for properly analyzed requirements.
+        Render the information table for properly analyzed requirements.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. All
-                given items should have a status "analyzed" else it would lead to
-                unexpected results or even errors.
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_analyzed_row()``.
 
         Returns:
-            string:
+            rich.table.Table: Table built from given rows.
         """
         table = Table(
             "#",
@@ -33,7 +40,7 @@ class RichFormatter(BaseStringFormatter):
             box=box.MINIMAL_HEAVY_HEAD,
         )
 
-        for item in super().build_analyzed_table(items):
+        for item in rows:
             table.add_row(
                 str(item["key"]),
                 item["name"],
@@ -44,17 +51,16 @@ class RichFormatter(BaseStringFormatter):
 
         return table
 
-    def build_errors_table(self, items):
+    def render_errors(self, rows):
         """
-        Build the information table for failed requirements analyze.
+        Render the information table for failed requirements analyze.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. Given
-                items could have any status despite not very useful for properly
-                analyzed items.
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_error_row()``.
 
         Returns:
-            string:
+            rich.table.Table: Table built from given rows.
         """
         table = Table(
             "#",
@@ -64,7 +70,7 @@ class RichFormatter(BaseStringFormatter):
             box=box.MINIMAL_HEAVY_HEAD,
         )
 
-        for item in super().build_errors_table(items):
+        for item in rows:
             table.add_row(
                 str(item["key"]),
                 item["source"],
@@ -74,28 +80,73 @@ class RichFormatter(BaseStringFormatter):
 
         return table
 
+    def iter_pages(self, rows):
+        """
+        Split rows into pages.
+
+        Arguments:
+            rows (list): List of row dictionnaries.
+
+        Returns:
+            iterator: Iterator of tuples for each page with respectively the page
+            number, the total page count and the page rows. Without a positive page
+            size there is always a single page, even if there is no rows.
+        """
+        if (
+            not self.page_size or
+            self.page_size < 1 or
+            len(rows) <= self.page_size
+        ):
+            yield 1, 1, rows
+            return
+
+        total = -(-len(rows) // self.page_size)
+        for i in range(total):
+            start = i * self.page_size
+            yield i + 1, total, rows[start:start + self.page_size]
+
+    def print_table(self, console, rows, renderer, title):
+        """
+        Print out a table in a panel for each page of rows.
+
+        Each page is printed as soon as it is rendered.
+
+        Arguments:
+            console (rich.console.Console): Console used to print.
+            rows (list): List of row dictionnaries.
+            renderer (callable): Method to render a table from rows.
+            title (string): Panel title.
+        """
+        for page, total, page_rows in self.iter_pages(rows):
+            page_title = title
+            if total > 1:
+                page_title += " ({}/{})".format(page, total)
+
+            console.print(Padding("", (1, 2), expand=False))
+            console.print(Panel(renderer(page_rows), title=page_title))
+
     def print(self, content, destination=None, with_failures=True):
         """
         Print out the analyzed and possible failures
         """
-        data = self.output(content)
+        report = self.build_report(content)
         console = Console(width=100, file=destination)
-        group_items = []
 
-        analyzed_table = self.build_analyzed_table(data)
-        group_items.append(Padding("", (1, 2), expand=False))
-        group_items.append(Panel(analyzed_table, title="[green]Analyzed[/green]"))
+        self.print_table(
+            console,
+            report.analyzed,
+            self.render_analyzed,
+            "[green]Analyzed[/green]",
+        )
 
         if with_failures:
-            failures = self.build_errors_table(data)
-            group_items.append(Padding("", (1, 2), expand=False))
-            group_items.append(
-                Panel(failures, title="[red]Failures[/red]")
+            self.print_table(
+                console,
+                report.failures,
+                self.render_errors,
+                "[red]Failures[/red]",
             )
 
-        panel_group = Group(*group_items)
-        console.print(panel_group)
-
         return console
 
     def write(self, content, destination, with_failures=True):
@@ -1,4 +1,4 @@
-from tabulate import tabulate
+import unicodedata
 
 from .base import BaseStringFormatter
 
@@ -6,18 +6,188 @@ from .base import BaseStringFormatter
 class RestructuredTextFormatter(BaseStringFormatter):
     """
     Format a requirements analyze to a RestructuredText report.
+
+    Tables are written as RestructuredText grid tables. Cell content is stripped from
+    leading and trailing whitespaces and can be on multiple lines. Cells are sized
+    on their display width so East Asian wide characters keep the grid aligned.
     """
-    def build_analyzed_table(self, items):
+    ANALYZED_HEADERS = ["#", "Name", "Lateness", "Required", "Latest release"]
+    ANALYZED_ALIGNS = ["left", "left", "center", "right", "right"]
+
+    ERRORS_HEADERS = ["#", "Source", "Status", "Resume"]
+    ERRORS_ALIGNS = ["left", "left", "center", "left"]
+
+    # Minimal amount of spaces around a header
+    HEADER_PADDING = 2
+
+    def get_cell_lines(self, value):
+        """
+        Split a cell value on its lines.
+
+        Arguments:
+            value (object): Cell value, it will be converted to a string and a null
+                value is an empty string.
+
+        Returns:
+            list: Lines from stripped cell value. There is always at least one line.
+        """
+        if value is None:
+            return [""]
+
+        return str(value).strip().splitlines() or [""]
+
+    def get_line_width(self, value):
+        """
+        Compute the display width of a cell line.
+
+        East Asian wide and fullwidth characters take two columns and combining
+        characters take none.
+
+        Arguments:
+            value (string): Cell line.
+
+        Returns:
+            integer: Amount of columns the line takes once displayed.
+        """
+        if value.isascii():
+            return len(value)
+
+        width = 0
+        for character in value:
+            if unicodedata.combining(character):
+                continue
+            elif unicodedata.east_asian_width(character) in ("W", "F"):
+                width += 2
+            else:
+                width += 1
+
+        return width
+
+    def get_grid_widths(self, headers, rows):
+        """
+        Compute column widths from headers and all rows.
+
+        Arguments:
+            headers (list): List of header labels.
+            rows (list): List of row cell lists.
+
+        Returns:
+            list: Width for each column, without the cell padding.
+        """
+        widths = [
+            self.get_line_width(label) + self.HEADER_PADDING
+            for label in headers
+        ]
+
+        for row in rows:
+            for i, value in enumerate(row):
+                widths[i] = max(
+                    widths[i],
+                    max(
+                        self.get_line_width(line)
+                        for line in self.get_cell_lines(value)
+                    )
+                )
+
+        return widths
+
+    def align_cell(self, value, width, align):
+        """
+        Align a cell line to a width.
+
+        Arguments:
+            value (string): Cell line.
+            width (integer): Column width.
+            align (string): Alignment name, either ``left``, ``center`` or
+                ``right``.
+
+        Returns:
+            string: Aligned cell line.
+        """
+        padding = max(width - self.get_line_width(value), 0)
+
+        if align == "left":
+            return value + (" " * padding)
+        elif align == "center":
+            before = padding // 2
+            return (" " * before) + value + (" " * (padding - before))
+
+        return (" " * padding) + value
+
+    def build_grid_row(self, row, widths, aligns):
+        """
+        Build lines for a table row.
+
+        Arguments:
+            row (list): List of row cells.
+            widths (list): Column widths.
+            aligns (list): Column alignments.
+
+        Returns:
+            list: Row lines, there will be as many lines than the highest cell line
+            count.
         """
-        Build the information table for properly analyzed requirements.
+        cells = [self.get_cell_lines(value) for value in row]
+        height = max(len(lines) for lines in cells)
+
+        return [
+            "| " + " | ".join([
+                self.align_cell(
+                    lines[i] if i < len(lines) else "",
+                    widths[k],
+                    aligns[k],
+                )
+                for k, lines in enumerate(cells)
+            ]) + " |"
+            for i in range(height)
+        ]
+
+    def iter_grid(self, headers, rows, aligns):
+        """
+        Iterate over a grid table lines.
+
+        Column widths are computed in a first pass over all rows then lines are
+        yielded row per row.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. All
-                given items should have a status "analyzed" else it would lead to
-                unexpected results or even errors.
+            headers (list): List of header labels.
+            rows (list): List of row cell lists.
+            aligns (list): Column alignments.
 
         Returns:
-            string: An ASCII table built from given items.
+            iterator: Iterator of table lines. Every line except the first one starts
+            with a newline character so joining them with an empty string gives
+            the full table.
+        """
+        widths = self.get_grid_widths(headers, rows)
+
+        separator = "+" + "+".join(["-" * (width + 2) for width in widths]) + "+"
+        header_separator = separator.replace("-", "=")
+
+        yield separator
+        for line in self.build_grid_row(headers, widths, aligns):
+            yield "\n" + line
+        yield "\n" + header_separator
+
+        for i, row in enumerate(rows):
+            if i > 0:
+                yield "\n" + separator
+            for line in self.build_grid_row(row, widths, aligns):
+                yield "\n" + line
+
+        if rows:
+            yield "\n" + separator
+
+    def iter_analyzed(self, rows):
+        """
+        Iterate over the information table chunks for properly analyzed requirements.
+
+        Arguments:
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_analyzed_row()``.
+
+        Returns:
+            iterator: Iterator of string chunks.
         """
         rows = [
             [
@@ -27,34 +197,23 @@ class RestructuredTextFormatter(BaseStringFormatter):
                 item["resolved_version"],
                 item["latest_release"],
             ]
-            for item in super().build_analyzed_table(items)
+            for item in rows
         ]
 
-        head = "Analyzed" + "\n" + ("*" * len("Analyzed")) + "\n"
-        return head + str(tabulate(
-            rows,
-            tablefmt="grid",
-            headers=[
-                "#",
-                "Name",
-                "Lateness",
-                "Required",
-                "Latest release",
-            ],
-            colalign=("left", "left", "center", "right", "right"),
-        ))
+        yield "Analyzed" + "\n" + ("*" * len("Analyzed")) + "\n"
+        yield from self.iter_grid(self.ANALYZED_HEADERS, rows, self.ANALYZED_ALIGNS)
 
-    def build_errors_table(self, items):
+    def iter_errors(self, rows):
         """
-        Build the information table for failed requirements analyze.
+        Iterate over the information table chunks for failed requirements analyze.
 
         Arguments:
-            items (list): List of requirement dict as returned from Analyzer. Given
-                items could have any status despite not very useful for properly
-                analyzed items.
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_error_row()``.
 
         Returns:
-            string: An ASCII table built from given items.
+            iterator: Iterator of string chunks. Nothing is yielded if there is no
+            rows.
         """
         rows = [
             [
@@ -63,21 +222,54 @@ class RestructuredTextFormatter(BaseStringFormatter):
                 item["status"],
                 item["resume"],
             ]
-            for item in super().build_errors_table(items)
+            for item in rows
         ]
 
         if not rows:
-            return ""
-
-        head = "\nFailures" + "\n" + ("*" * len("Failures")) + "\n"
-        return head + str(tabulate(
-            rows,
-            tablefmt="grid",
-            headers=[
-                "#",
-                "Source",
-                "Status",
-                "Resume",
-            ],
-            colalign=("left", "left", "center", "left"),
-        ))
+            return
+
+        yield "\nFailures" + "\n" + ("*" * len("Failures")) + "\n"
+        yield from self.iter_grid(self.ERRORS_HEADERS, rows, self.ERRORS_ALIGNS)
+
+    def render_analyzed(self, rows):
+        """
+        Render the information table for properly analyzed requirements.
+
+        Arguments:
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_analyzed_row()``.
+
+        Returns:
+            string: An ASCII table built from given rows.
+        """
+        return "".join(self.iter_analyzed(rows))
+
+    def render_errors(self, rows):
+        """
+        Render the information table for failed requirements analyze.
+
+        Arguments:
+            rows (list): List of row dictionnaries as built from
+                ``BaseFormatter.build_error_row()``.
+
+        Returns:
+            string: An ASCII table built from given rows.
+        """
+        return "".join(self.iter_errors(rows))
+
+    def write(self, content, destination, with_failures=True):
+        """
+        Write the analyzed and possibly failures into destination file.
+
+        Tables are written line per line to the destination file without to build
+        the whole report string.
+        """
+        report = self.build_report(content)
+
+        with destination.open("w") as fp:
+            fp.writelines(self.iter_analyzed(report.analyzed))
+
+            if with_failures:
+                fp.writelines(self.iter_errors(report.failures))
+
+        return destination
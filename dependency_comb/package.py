@@ -1,4 +1,261 @@
+import copy
+import re
+
+from collections import namedtuple
+from functools import lru_cache
+
 from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
+from .utils.dates import safe_isoformat_parse
+
+
+# Maximum amount of distinct requirement lines and marker evaluations to keep in
+# memory caches
+PARSING_CACHE_SIZE = 4096
+
+# Simple requirement line with a package name (as defined in PEP 508) and an optional
+# pinned version, like the ones from 'pip freeze'
+SIMPLE_REQUIREMENT_REGEX = re.compile(
+    r"^(?P<name>[A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9])"
+    r"(?:\s*==\s*(?P<version>[A-Z0-9.!+_-]+))?$",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=PARSING_CACHE_SIZE)
+def _cached_isoformat(value, kind, tzinfo):
+    # Type and timezone are part of the cache key since equal dates may have a
+    # different ISO form
+    return value.isoformat()
+
+
+def serialize_value(value):
+    """
+    Get the JSON string form of a version, specifier or date.
+
+    The same release dates are commonly shared by many requirements so their ISO
+    form is memoized. Versions and specifiers are not memoized since different
+    strings can be equal (like ``2.0`` and ``2.0.0``).
+
+    Arguments:
+        value (object): A value to convert. Dates are converted to ISO format and
+            other objects with ``str()``. A string or null value is returned as is.
+
+    Returns:
+        string: The value string form.
+    """
+    if value is None or isinstance(value, str):
+        return value
+
+    if hasattr(value, "isoformat"):
+        return _cached_isoformat(value, type(value), getattr(value, "tzinfo", None))
+
+    return str(value)
+
+
+def get_lateness_count(lateness):
+    """
+    Get the amount of missed releases from a requirement lateness.
+
+    Arguments:
+        lateness (list or dict): Either the list of missed releases or a lateness
+            summary as built from ``PackageRequirement.lateness_summary()``.
+
+    Returns:
+        integer: The amount of missed releases or None if lateness is null.
+    """
+    if lateness is None:
+        return None
+
+    if isinstance(lateness, dict):
+        return lateness["count"]
+
+    return len(lateness)
+
+
+def get_days_behind(item):
+    """
+    Get the amount of days behind from a requirement data.
+
+    Arguments:
+        item (dict): Requirement data dictionnary, either from
+            ``PackageRequirement.data()`` or from a manifest.
+
+    Returns:
+        integer: Days behind from requirement data if any, else computed from
+        resolved and highest release dates for manifests built before this value
+        was available. It is zero for requirements without a resolved release.
+    """
+    if item.get("days_behind") is not None:
+        return item["days_behind"]
+
+    if not item.get("resolved_published") or not item.get("highest_published"):
+        return 0
+
+    resolved, highest = [
+        safe_isoformat_parse(value) if isinstance(value, str) else value
+        for value in (item["resolved_published"], item["highest_published"])
+    ]
+
+    return max((highest - resolved).days, 0)
+
+
+def aggregate_age(requirements):
+    """
+    Aggregate the age metrics of requirements, commonly from a project.
+
+    Arguments:
+        requirements (iterable): Either ``PackageRequirement`` objects or their
+            data dictionnaries (as from a manifest).
+
+    Returns:
+        dict: Aggregated metrics with items ``packages`` for the amount of
+        requirements with metrics, ``days_behind`` for the sum of their days behind
+        and ``libyear`` for the sum of their libyear.
+    """
+    packages = 0
+    days_behind = 0
+
+    for item in requirements:
+        value = (
+            item.get("days_behind") if isinstance(item, dict) else item.days_behind
+        )
+        if value is not None:
+            packages += 1
+            days_behind += value
+
+    return {
+        "packages": packages,
+        "days_behind": days_behind,
+        "libyear": round(days_behind / 365.25, 2),
+    }
+
+
+PackageRelease = namedtuple("PackageRelease", ["number", "published_at"])
+PackageRelease.__doc__ = """
+Compact record for a package release.
+
+Releases are built in large amount when analyzing requirements so they are stored
+as tuples instead of dictionnaries.
+
+Attributes:
+    number (string or packaging.version.Version): Release version number.
+    published_at (string or datetime.datetime): Release publishing date.
+"""
+
+
+def parse_simple_requirement(source):
+    """
+    Fast path parser for simple requirement lines.
+
+    It only supports a package name with an optional pinned version (like
+    ``django==3.2.1`` or ``django``) and directly builds the ``Requirement`` object
+    without to involve the full requirement grammar.
+
+    Arguments:
+        source (string): A stripped requirement line to parse.
+
+    Returns:
+        packaging.requirements.Requirement: The requirement object or None if source
+        is not a simple requirement line or has an invalid version. In this case the
+        full parser should be used.
+    """
+    match = SIMPLE_REQUIREMENT_REGEX.match(source)
+    if not match:
+        return None
+
+    version = match.group("version")
+    try:
+        specifier = SpecifierSet("==" + version if version else "")
+    except InvalidSpecifier:
+        return None
+
+    # Mimic the attributes set from the Requirement constructor
+    requirement = Requirement.__new__(Requirement)
+    requirement.name = match.group("name")
+    requirement.url = None
+    requirement.extras = set()
+    requirement.specifier = specifier
+    requirement.marker = None
+
+    return requirement
+
+
+@lru_cache(maxsize=PARSING_CACHE_SIZE)
+def parse_requirement_line(source):
+    """
+    Parse a requirement line with memoization.
+
+    The same lines commonly occur many times when analyzing multiple requirement
+    files so the parsing result is cached on the stripped source line. Also simple
+    lines are parsed with ``parse_simple_requirement()`` and only the other ones use
+    the full requirement grammar.
+
+    .. Warning::
+        Returned ``Requirement`` object is shared between every call for the same
+        source, you should not modify it and use ``copy_requirement()`` to get an
+        object of your own.
+
+    Arguments:
+        source (string): A stripped requirement line to parse.
+
+    Returns:
+        tuple: The ``Requirement`` object (or None if parsing failed) and the
+        ``InvalidRequirement`` exception object (or None if parsing succeeded).
+    """
+    requirement = parse_simple_requirement(source)
+    if requirement:
+        return requirement, None
+
+    try:
+        return Requirement(source), None
+    except InvalidRequirement as e:
+        return None, e
+
+
+def copy_requirement(requirement):
+    """
+    Copy a requirement object with its own mutable parts.
+
+    This is a lot cheaper than parsing the source again. Extras and the specifier set
+    are copied so they can be modified without to affect the original object.
+
+    Arguments:
+        requirement (packaging.requirements.Requirement): Requirement object to
+            copy.
+
+    Returns:
+        packaging.requirements.Requirement: The copied requirement object.
+    """
+    copied = copy.copy(requirement)
+    copied.extras = set(requirement.extras)
+    copied.specifier = copy.copy(requirement.specifier)
+
+    return copied
+
+
+@lru_cache(maxsize=PARSING_CACHE_SIZE)
+def _cached_marker_evaluation(marker, environment):
+    return marker.evaluate(dict(environment))
+
+
+def evaluate_marker(marker, environment):
+    """
+    Evaluate a marker against environment variables with memoization.
+
+    Arguments:
+        marker (packaging.markers.Marker): The marker to evaluate.
+        environment (dict): Environment variables to evaluate marker against.
+
+    Returns:
+        boolean: Marker evaluation result.
+    """
+    try:
+        return _cached_marker_evaluation(marker, tuple(sorted(environment.items())))
+    # Environment with unhashable values can not be cached
+    except TypeError:
+        return marker.evaluate(environment)
 
 
 class PackageRequirement:
@@ -70,6 +327,10 @@ class PackageRequirement:
         extras (set): Possible parsed set of extras environ names from source.
         parsing_error (object): The exception object raise from
             ``packaging.Requirement`` when there was a parsing error.
+        days_behind (integer): Amount of days between the resolved release and the
+            highest release publish dates. This value will be null if there is no
+            resolved version.
+        libyear (float): The days behind value in years, rounded to two decimals.
     """
     STATUS_LABELS = {
         "parsed": "Parsed requirement syntax",
@@ -86,8 +347,11 @@ class PackageRequirement:
         "extras", "highest_published", "highest_version", "lateness",
         "marker", "name", "parsed", "pypi_url", "repository_url",
         "source", "specifier", "status", "url", "resolved_version",
-        "resolved_published", "parsing_error",
+        "resolved_published", "parsing_error", "days_behind", "libyear",
     ]
+    # Requirements are created in large amount so we avoid the per instance
+    # dictionnary
+    __slots__ = ["environment"] + PUBLISHED_ATTRIBUTES
 
     def __init__(self, source, environment=None):
         self.source = source
@@ -109,6 +373,8 @@ class PackageRequirement:
         self.resolved_version = None
         self.resolved_published = None
         self.parsing_error = None
+        self.days_behind = None
+        self.libyear = None
 
         # Check if source syntax is supported
         if self.source.startswith("-"):
@@ -118,12 +384,14 @@ class PackageRequirement:
         elif self.source.startswith(("http://", "https://")):
             self.status = "unsupported-url"
         else:
-            try:
-                self.parsed = Requirement(self.source)
-            except InvalidRequirement as e:
+            parsed, self.parsing_error = parse_requirement_line(self.source)
+
+            if self.parsing_error:
                 self.status = "invalid"
-                self.parsing_error = e
             else:
+                # Cached parsing result is shared so each requirement owns a copy
+                self.parsed = copy_requirement(parsed)
+
                 # Initialize basic details from parsed source
                 self.name = self.parsed.name
                 self.url = self.parsed.url
@@ -137,7 +405,7 @@ class PackageRequirement:
                 if (
                     self.environment and
                     self.marker and
-                    self.marker.evaluate(self.environment) is False
+                    evaluate_marker(self.marker, self.environment) is False
                 ):
                     self.status = "marker-reject"
                 else:
@@ -160,6 +428,31 @@ class PackageRequirement:
         """
         return self.status in self.VALID_STATUSES
 
+    def evaluate_environment(self, environment):
+        """
+        Get the requirement status for an environment.
+
+        This only involves the marker evaluation since everything else does not depend
+        from environment, so it can be used on an already analyzed requirement to
+        check it against other environments.
+
+        Arguments:
+            environment (dict): Environment variables to evaluate marker against.
+
+        Returns:
+            string: Either ``marker-reject`` if marker does not match environment or
+            else the current requirement status.
+        """
+        if (
+            self.is_valid and
+            environment and
+            self.marker and
+            evaluate_marker(self.marker, environment) is False
+        ):
+            return "marker-reject"
+
+        return self.status
+
     def data(self):
         """
         Return public attributes into a dictionnary.
@@ -168,3 +461,78 @@ class PackageRequirement:
             dict: The public attributes to publish.
         """
         return {k: getattr(self, k) for k in self.PUBLISHED_ATTRIBUTES}
+
+    def lateness_summary(self):
+        """
+        Return a compact summary of lateness.
+
+        Returns:
+            dict: The summary with items ``count`` for the amount of missed releases,
+            ``oldest`` and ``newest`` for the lowest and highest missed releases as
+            a list of version and publish date (null if there is no missed release)
+            and ``libyear`` for the time in years between resolved and highest
+            releases. Summary is null if there is no lateness.
+        """
+        if self.lateness is None:
+            return None
+
+        oldest = newest = None
+        if self.lateness:
+            oldest = [serialize_value(value) for value in self.lateness[0]]
+            newest = [serialize_value(value) for value in self.lateness[-1]]
+
+        return {
+            "count": len(self.lateness),
+            "oldest": oldest,
+            "newest": newest,
+            "libyear": self.libyear,
+        }
+
+    def json_data(self, lateness_summary=False):
+        """
+        Return public attributes into a dictionnary of JSON native values.
+
+        Values are converted to their string form so the dictionnary can be
+        serialized without any specific JSON encoder. It is serialized the same
+        than ``PackageRequirement.data()`` with ``ExtendedJsonEncoder``.
+
+        Keyword Arguments:
+            lateness_summary (boolean): If enabled, the lateness item is the summary
+                from ``PackageRequirement.lateness_summary()`` instead of the list of
+                all missed releases.
+
+        Returns:
+            dict: The public attributes to publish.
+        """
+        if lateness_summary:
+            lateness = self.lateness_summary()
+        elif self.lateness is None:
+            lateness = None
+        else:
+            lateness = [
+                [serialize_value(number), serialize_value(published_at)]
+                for number, published_at in self.lateness
+            ]
+
+        return {
+            "extras": None if self.extras is None else list(self.extras),
+            "highest_published": serialize_value(self.highest_published),
+            "highest_version": serialize_value(self.highest_version),
+            "lateness": lateness,
+            "marker": None if self.marker is None else str(self.marker),
+            "name": self.name,
+            "parsed": None if self.parsed is None else str(self.parsed),
+            "pypi_url": self.pypi_url,
+            "repository_url": self.repository_url,
+            "source": self.source,
+            "specifier": serialize_value(self.specifier),
+            "status": self.status,
+            "url": self.url,
+            "resolved_version": serialize_value(self.resolved_version),
+            "resolved_published": serialize_value(self.resolved_published),
+            "parsing_error": (
+                None if self.parsing_error is None else str(self.parsing_error)
+            ),
+            "days_behind": self.days_behind,
+            "libyear": self.libyear,
+        }
@@ -1,3 +1,6 @@
+import json
+import re
+
 from pathlib import Path
 
 from .exceptions import RequirementParserError
@@ -9,18 +12,41 @@ class RequirementParser:
     Parse a requirements file content to resolve each requirement line as a
     ``PackageRequirement`` object.
 
-    Multiline directive is not supported.
+    Lines ending with a backslash are joined with the following ones and hash options
+    (``--hash=sha256:...``) are removed, so lock files (like from ``pip-compile``)
+    result to their requirements only.
+
+    Included requirement files are parsed only once per parser instance, their
+    parsed lines are reused for every other inclusion of the same file as long as the
+    file has not been modified. Each inclusion still gets new ``PackageRequirement``
+    objects since the analyzer modifies them.
+
+    Attributes:
+        inclusion_graph (dict): Included file paths indexed on the file path which
+            include them. Requirements given as a string or a file object are
+            indexed on a null key. Inclusions of a file are reset each time it is
+            parsed.
+        inclusion_cache (dict): Parsed requirement lines from included files indexed
+            on a key made from file path, basepath and environment. Each entry is a
+            tuple of the modification times for every file involved in the
+            inclusion and the list of requirement lines.
     """
-    def get_nested_content(self, line, basepath):
+    HASH_OPTION_REGEX = re.compile(r"(^|\s+)--hash(=|\s+)\S+")
+
+    def __init__(self):
+        self.inclusion_graph = {}
+        self.inclusion_cache = {}
+
+    def get_nested_path(self, line, basepath):
         """
-        Find the requirement file to include its content from an inclusion directive.
+        Find the requirement file to include from an inclusion directive.
 
         Arguments:
             line (string):
             basepath (Path):
 
         Returns:
-            string: The file content to include.
+            Path: The file path to include.
         """
         parts = line.split()
 
@@ -36,23 +62,187 @@ class RequirementParser:
                 "Unable to find included source: {}".format(requirement_path)
             )
 
+        return requirement_path
+
+    def get_nested_content(self, line, basepath):
+        """
+        Find the requirement file to include its content from an inclusion directive.
+
+        Arguments:
+            line (string):
+            basepath (Path):
+
+        Returns:
+            string: The file content to include.
+        """
+        requirement_path = self.get_nested_path(line, basepath)
+        if not requirement_path:
+            return None
+
         return requirement_path.read_text()
 
-    def parse_recursive_lines(self, content, environment=None, basepath=None):
+    def iter_lines(self, content):
         """
-        Recursively parse requirement lines to store them as PackageRequirement objects.
+        Iterate over lines from given content.
 
-        Inclusion directive are resolved and replaced with their requirements if
-        basepath is given. Commentaries and empty lines (starting with ``#``) are
-        directly filtered out at this stage.
+        Arguments:
+            content (string or Path or file object): Either a string for the content
+                to parse, a Path object to open or an opened file object (like the
+                standard input). Files are read line by line.
+
+        Returns:
+            iterator: Iterator of content lines.
+        """
+        if isinstance(content, Path):
+            with content.open() as fp:
+                yield from fp
+        elif isinstance(content, str):
+            yield from content.splitlines()
+        else:
+            yield from content
+
+    def get_inclusion_mtimes(self, path):
+        """
+        Get modification times of an included file and all of its own inclusions.
+
+        Arguments:
+            path (Path): Resolved included file path.
+
+        Returns:
+            dict: Modification times in nanoseconds indexed on file paths.
+        """
+        mtimes = {}
+        pending = [path]
+
+        while pending:
+            item = pending.pop()
+            if item not in mtimes:
+                mtimes[item] = item.stat().st_mtime_ns
+                pending.extend(self.inclusion_graph.get(item, []))
+
+        return mtimes
+
+    def is_inclusion_cache_fresh(self, key):
+        """
+        Check if there is a cache entry for given key which is still valid, meaning
+        no involved file has been modified or removed since it has been cached.
+
+        Arguments:
+            key (tuple): Cache key.
+
+        Returns:
+            boolean: True if cache entry exists and is valid, else False.
+        """
+        if key not in self.inclusion_cache:
+            return False
+
+        for path, mtime in self.inclusion_cache[key][0].items():
+            try:
+                if path.stat().st_mtime_ns != mtime:
+                    return False
+            except FileNotFoundError:
+                return False
+
+        return True
+
+    def iter_inclusion(self, path, environment=None, basepath=None, parents=None):
+        """
+        Parse an included requirement file with cache and circular inclusion check.
+
+        Requirement lines from an included file are collected while their
+        requirements are yielded and then cached once the file has been fully
+        parsed.
+
+        Arguments:
+            path (Path): Included file path.
+
+        Keyword Arguments:
+            environment (dict): Environment variables for marker evaluations.
+            basepath (Path): A directory path where to search for requirement
+                inclusions.
+            parents (tuple): Resolved file paths from the current inclusion chain.
+
+        Returns:
+            iterator: Iterator of PackageRequirement objects from included file.
+        """
+        parents = parents or tuple()
+        path = path.resolve()
+
+        edges = self.inclusion_graph.setdefault(parents[-1] if parents else None, [])
+        if path not in edges:
+            edges.append(path)
+
+        if path in parents:
+            raise RequirementParserError(
+                "Circular inclusion detected: {}".format(
+                    " -> ".join([str(item) for item in parents + (path,)])
+                )
+            )
+
+        cache_key = (path, basepath, json.dumps(environment, sort_keys=True))
+        if self.is_inclusion_cache_fresh(cache_key):
+            for source in self.inclusion_cache[cache_key][1]:
+                yield PackageRequirement(source, environment=environment)
+            return
+
+        collected = []
+        for item in self.iter_requirements(
+            path,
+            environment=environment,
+            basepath=basepath,
+            parents=parents,
+        ):
+            collected.append(item.source)
+            yield item
+
+        self.inclusion_cache[cache_key] = (self.get_inclusion_mtimes(path), collected)
+
+    def iter_logical_lines(self, content):
+        """
+        Iterate over logical lines from given content.
+
+        Lines ending with a backslash are joined with the following ones and hash
+        options are removed. This is done in a single pass while content is read.
+
+        Arguments:
+            content (string or Path or file object): Content to load, see
+                ``RequirementParser.iter_lines()`` for supported types.
+
+        Returns:
+            iterator: Iterator of stripped logical lines.
+        """
+        buffer = []
+
+        for line in self.iter_lines(content):
+            line = line.strip()
+
+            # Commentaries are never continued
+            if line.endswith("\\") and not line.startswith("#"):
+                buffer.append(line[:-1])
+                continue
+
+            buffer.append(line)
+            line = self.HASH_OPTION_REGEX.sub("", " ".join(buffer)).strip()
+            buffer = []
+
+            yield line
+
+        # Remaining content when last line is ending with a backslash
+        if buffer:
+            yield self.HASH_OPTION_REGEX.sub("", " ".join(buffer)).strip()
+
+    def iter_requirements(self, content, environment=None, basepath=None,
+                          parents=None):
+        """
+        Lazily parse requirement lines to yield them as PackageRequirement objects.
 
-        .. Warning::
-            There is no check about circular import in inclusions (like a ``base.txt``
-            requirement including ``dev.txt`` requirement which include ``base.txt``).
+        Content is read line by line and inclusion directives are resolved only when
+        they are reached, so requirements can be processed before the whole content
+        has been read.
 
         Arguments:
-            content (string or Path): Content to load. Either a string for the content
-            to parse or a Path object to open and read as content to parse.
+            content (string or Path or file object): Content to load, see
+                ``RequirementParser.iter_lines()`` for supported types.
 
         Keyword Arguments:
             environment (dict): Environment variables as defined from
@@ -62,43 +252,79 @@ class RequirementParser:
                 inclusions (directive ``-r foo.txt``) from requirements file. If not
                 given inclusions will be ignored and PackageRequirement will assume it
                 as an unsupported argument.
+            parents (tuple): Resolved file paths from the current inclusion chain,
+                this is used internally to detect circular inclusions.
 
         Returns:
-            list: List of PackageRequirement objects for all involved requirements.
+            iterator: Iterator of PackageRequirement objects for all involved
+            requirements.
         """
+        parents = parents or tuple()
         if isinstance(content, Path):
-            content = content.read_text()
+            path = content.resolve()
+            parents += (path,)
+            # Inclusions are collected again since they may have changed
+            self.inclusion_graph[path] = []
 
-        resolved = []
-        for line in content.splitlines():
+        for line in self.iter_logical_lines(content):
             # Always ignore empty lines and commentaries
-            if not line.strip() or line.strip().startswith("#"):
+            if not line or line.startswith("#"):
                 continue
             # Inclusion directive to resolve
-            elif basepath and line.strip().startswith("-r "):
-                inclusion = self.get_nested_content(line, basepath)
+            elif basepath and line.startswith("-r "):
+                inclusion = self.get_nested_path(line, basepath)
                 if inclusion:
-                    resolved.extend(self.parse_recursive_lines(
+                    yield from self.iter_inclusion(
                         inclusion,
                         environment=environment,
-                        basepath=basepath
-                    ))
+                        basepath=basepath,
+                        parents=parents,
+                    )
             # Default behavior for everything else (that can be valid, invalid,
             # unsupported, etc..), package parser will take it in charge
             else:
-                resolved.append(
-                    PackageRequirement(line.strip(), environment=environment)
-                )
+                yield PackageRequirement(line, environment=environment)
+
+    def parse_recursive_lines(self, content, environment=None, basepath=None):
+        """
+        Recursively parse requirement lines to store them as PackageRequirement objects.
+
+        Inclusion directive are resolved and replaced with their requirements if
+        basepath is given. Commentaries and empty lines (starting with ``#``) are
+        directly filtered out at this stage.
+
+        A circular inclusion (like a ``base.txt`` requirement including ``dev.txt``
+        requirement which include ``base.txt``) raises a ``RequirementParserError``.
+
+        Arguments:
+            content (string or Path or file object): Content to load, see
+                ``RequirementParser.iter_lines()`` for supported types.
+
+        Keyword Arguments:
+            environment (dict): Environment variables as defined from
+                `PEP 508 <https://peps.python.org/pep-0508/>` to use for marker
+                evaluations on parsed requirement items.
+            basepath (Path): A directory path where to search for requirement
+                inclusions (directive ``-r foo.txt``) from requirements file. If not
+                given inclusions will be ignored and PackageRequirement will assume it
+                as an unsupported argument.
 
-        return resolved
+        Returns:
+            list: List of PackageRequirement objects for all involved requirements.
+        """
+        return list(self.iter_requirements(
+            content,
+            environment=environment,
+            basepath=basepath
+        ))
 
     def parse_requirements(self, content, environment=None, basepath=None):
         """
         Load content as requirements.
 
         Arguments:
-            content (string or Path): Content to load. Either a string for the content
-            to parse or a Path object to open and read as content to parse.
+            content (string or Path or file object): Content to load, see
+                ``RequirementParser.iter_lines()`` for supported types.
 
         Keyword Arguments:
             environment (dict): Environment variables as defined from
@@ -0,0 +1,136 @@
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+
+
+# Default patterns to match requirement files
+DEFAULT_PATTERNS = ["requirements*.txt", "requirements/*.txt"]
+
+# Default patterns for directories and files to ignore
+DEFAULT_IGNORES = [
+    ".git", ".hg", ".tox", ".venv", "venv", "node_modules", "__pycache__",
+]
+
+
+class RequirementScanner:
+    """
+    Discover requirement files in a directory tree.
+
+    Patterns are matched against the file name and against the file path relative to
+    its parent directory (like ``requirements/base.txt``). Ignore patterns are
+    matched against every file or directory name and against their path relative to
+    the base directory, an ignored directory is not walked at all.
+
+    Top level directories are walked in parallel.
+
+    Keyword Arguments:
+        patterns (list): Patterns to match requirement files. Default to
+            ``DEFAULT_PATTERNS``.
+        ignores (list): Patterns for files or directories to ignore. Default to
+            ``DEFAULT_IGNORES``.
+        workers (integer): Maximum amount of threads to walk directories. Default
+            to None to let ``ThreadPoolExecutor`` decide.
+    """
+    def __init__(self, patterns=None, ignores=None, workers=None):
+        self.patterns = patterns or DEFAULT_PATTERNS
+        self.ignores = DEFAULT_IGNORES if ignores is None else ignores
+        self.workers = workers
+
+    def is_ignored(self, path, basedir):
+        """
+        Check if a path is ignored.
+
+        Arguments:
+            path (Path): Path to check.
+            basedir (Path): Base directory of the scan.
+
+        Returns:
+            boolean: True if path match any ignore pattern.
+        """
+        relative = path.relative_to(basedir).as_posix()
+
+        return any(
+            fnmatch(path.name, pattern) or fnmatch(relative, pattern)
+            for pattern in self.ignores
+        )
+
+    def is_requirement_file(self, path):
+        """
+        Check if a file path is a requirement file.
+
+        Arguments:
+            path (Path): File path to check.
+
+        Returns:
+            boolean: True if path match any requirement pattern.
+        """
+        parented = "/".join(path.parts[-2:])
+
+        return any(
+            fnmatch(path.name, pattern) or fnmatch(parented, pattern)
+            for pattern in self.patterns
+        )
+
+    def walk(self, directory, basedir):
+        """
+        Recursively find requirement files from a directory.
+
+        Arguments:
+            directory (Path): Directory to walk.
+            basedir (Path): Base directory of the scan.
+
+        Returns:
+            list: Found requirement file paths.
+        """
+        found = []
+
+        for root, dirnames, filenames in os.walk(directory):
+            root = Path(root)
+            # Prune ignored directories so they are not walked
+            dirnames[:] = [
+                name for name in dirnames
+                if not self.is_ignored(root / name, basedir)
+            ]
+
+            for name in filenames:
+                path = root / name
+                if (
+                    self.is_requirement_file(path) and
+                    not self.is_ignored(path, basedir)
+                ):
+                    found.append(path)
+
+        return found
+
+    def scan(self, basedir):
+        """
+        Find all requirement files in a directory tree.
+
+        Arguments:
+            basedir (Path): Directory to scan.
+
+        Returns:
+            list: Found requirement file paths, sorted.
+        """
+        found = []
+        directories = []
+
+        for path in basedir.iterdir():
+            if self.is_ignored(path, basedir):
+                continue
+
+            if path.is_dir():
+                directories.append(path)
+            elif self.is_requirement_file(path):
+                found.append(path)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for paths in executor.map(
+                lambda item: self.walk(item, basedir),
+                directories
+            ):
+                found.extend(paths)
+
+        return sorted(found)
@@ -0,0 +1,295 @@
+import heapq
+
+from array import array
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from .package import get_days_behind, get_lateness_count
+from .utils.jsons import iter_json_items, json_loads
+from .utils.msgpacks import MSGPACK_MAGIC, is_msgpack_manifest, iter_msgpack_items
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Default percentiles to compute
+DEFAULT_PERCENTILES = [50, 90, 99]
+
+# Columns available for percentiles and top selection
+NUMERIC_COLUMNS = ("lateness", "days_behind")
+
+
+class FleetStatistics:
+    """
+    Compute statistics over analyzed requirements from many manifests.
+
+    Analyzed requirements are loaded into columns where numeric values are stored in
+    compact arrays. Statistics are computed with ``numpy`` when it is installed,
+    else with the standard library.
+
+    Requirements without a resolved version are assumed to use the latest release,
+    so they have no lateness and are not behind. Only requirements with status
+    ``analyzed`` are loaded.
+
+    Attributes:
+        projects (list): Names of loaded projects.
+        names (list): Package name of each requirement.
+        project_indexes (array.array): Project index of each requirement.
+        versions (list): Resolved version of each requirement, null if not resolved.
+        lateness (array.array): Amount of missed releases of each requirement.
+        days_behind (array.array): Amount of days behind of each requirement.
+        ignored (integer): Amount of ignored requirements which have not been
+            analyzed.
+    """
+    def __init__(self):
+        self.projects = []
+        self.names = []
+        self.project_indexes = array("q")
+        self.versions = []
+        self.lateness = array("q")
+        self.days_behind = array("q")
+        self.ignored = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_items(self, items, project):
+        """
+        Load requirement items for a project.
+
+        Arguments:
+            items (iterable): Requirement items (as dictionnaries from a manifest).
+            project (string): Project name.
+
+        Returns:
+            integer: Amount of loaded requirements.
+        """
+        index = len(self.projects)
+        self.projects.append(project)
+        loaded = 0
+
+        for item in items:
+            if item["status"] != "analyzed":
+                self.ignored += 1
+                continue
+
+            self.names.append(item["name"])
+            self.project_indexes.append(index)
+            self.versions.append(item["resolved_version"])
+            self.lateness.append(get_lateness_count(item["lateness"]) or 0)
+            self.days_behind.append(get_days_behind(item))
+            loaded += 1
+
+        return loaded
+
+    def add_manifest(self, path):
+        """
+        Load requirements from a manifest file.
+
+        Manifest can be an analyze manifest (from ``analyze`` command, as JSON,
+        NDJSON or MessagePack) which is loaded as a project named on the file path.
+        Or an aggregated manifest (from ``batch`` or ``scan`` commands) where each
+        item is loaded as a project.
+
+        The file is opened once, JSON list and NDJSON are incrementally parsed and
+        only an aggregated manifest is parsed at once.
+
+        Arguments:
+            path (Path): Manifest file path.
+
+        Returns:
+            integer: Amount of loaded requirements.
+        """
+        path = Path(path)
+
+        with path.open(encoding="utf-8") as fp:
+            # Magic bytes are peeked from the binary buffer before any text is read
+            if is_msgpack_manifest(fp.buffer.peek(len(MSGPACK_MAGIC))):
+                return self.add_items(iter_msgpack_items(fp.buffer), str(path))
+
+            first = fp.read(1)
+            while first and first.isspace():
+                first = fp.read(1)
+
+            # Aggregated manifest is a single object of analyzes indexed on project
+            # which can only be parsed at once. A first line which is a requirement
+            # object means it is NDJSON.
+            if first == "{":
+                content = first + fp.readline()
+                try:
+                    data = json_loads(content)
+                except ValueError:
+                    # Indented aggregated manifest is on many lines
+                    data = json_loads(content + fp.read())
+
+                if "status" not in data:
+                    return sum(
+                        self.add_items(items, project)
+                        for project, items in data.items()
+                    )
+
+            # JSON list or NDJSON is incrementally parsed from the start
+            fp.seek(0)
+
+            return self.add_items(iter_json_items(fp), str(path))
+
+    def get_column(self, name):
+        """
+        Get a numeric column.
+
+        Arguments:
+            name (string): Column name from ``NUMERIC_COLUMNS``.
+
+        Returns:
+            numpy.ndarray or array.array: Column values, as a numpy array if numpy
+            is installed.
+        """
+        if name not in NUMERIC_COLUMNS:
+            raise ValueError("Unknowed statistic column: {}".format(name))
+
+        column = getattr(self, name)
+        if numpy is not None:
+            return numpy.frombuffer(column, dtype=numpy.int64)
+
+        return column
+
+    def percentiles(self, name, percentiles=None):
+        """
+        Compute percentiles of a numeric column.
+
+        Percentiles are computed with a linear interpolation between closest ranks
+        and rounded to two decimals.
+
+        Arguments:
+            name (string): Column name from ``NUMERIC_COLUMNS``.
+
+        Keyword Arguments:
+            percentiles (list): Percentiles to compute, between 0 and 100. Default to
+                ``DEFAULT_PERCENTILES``.
+
+        Returns:
+            dict: Computed values indexed on percentile. Values are null if there is
+            no requirements.
+        """
+        percentiles = percentiles or DEFAULT_PERCENTILES
+        column = self.get_column(name)
+
+        if not len(column):
+            return {q: None for q in percentiles}
+
+        if numpy is not None:
+            values = numpy.percentile(column, percentiles)
+            return {
+                q: round(float(value), 2) for q, value in zip(percentiles, values)
+            }
+
+        # Same interpolation than numpy so both ways give identical results
+        ordered = sorted(column)
+        last = len(ordered) - 1
+        computed = {}
+        for q in percentiles:
+            position = q / 100 * last
+            lower = int(position)
+            low = ordered[lower]
+            high = ordered[min(lower + 1, last)]
+            weight = position - lower
+
+            if weight >= 0.5:
+                value = high - (high - low) * (1 - weight)
+            else:
+                value = low + (high - low) * weight
+
+            computed[q] = round(value, 2)
+
+        return computed
+
+    def top(self, name, size=10):
+        """
+        Get the most outdated requirements on a numeric column.
+
+        Arguments:
+            name (string): Column name from ``NUMERIC_COLUMNS``.
+
+        Keyword Arguments:
+            size (integer): Amount of requirements to return, it can not be
+                negative.
+
+        Returns:
+            list: Dictionnaries with items ``name``, ``project``, ``version`` and the
+            column value, ordered from the highest column value. Requirements with
+            the same value keep their loading order.
+        """
+        if size < 0:
+            raise ValueError("Given top size can not be negative: {}".format(size))
+
+        column = self.get_column(name)
+
+        if numpy is not None:
+            indexes = numpy.argsort(-column, kind="stable")[:size].tolist()
+        else:
+            indexes = heapq.nsmallest(
+                size,
+                range(len(column)),
+                key=lambda i: (-column[i], i),
+            )
+
+        return [
+            {
+                "name": self.names[i],
+                "project": self.projects[self.project_indexes[i]],
+                "version": self.versions[i],
+                name: int(column[i]),
+            }
+            for i in indexes
+        ]
+
+    def pin_distribution(self):
+        """
+        Count resolved versions for each package.
+
+        Returns:
+            dict: Dictionnaries of version counts indexed on package names, both
+            are ordered by name and versions are ordered from the most used. Not
+            resolved versions are counted as ``latest``.
+        """
+        distribution = defaultdict(Counter)
+
+        for name, version in zip(self.names, self.versions):
+            distribution[name][version or "latest"] += 1
+
+        return {
+            name: dict(distribution[name].most_common())
+            for name in sorted(distribution)
+        }
+
+    def summary(self, percentiles=None, top=10):
+        """
+        Compute all statistics.
+
+        Keyword Arguments:
+            percentiles (list): Percentiles to compute. Default to
+                ``DEFAULT_PERCENTILES``.
+            top (integer): Amount of most outdated requirements to return.
+
+        Returns:
+            dict: All statistics.
+        """
+        total_days = sum(self.days_behind)
+
+        return {
+            "projects": len(self.projects),
+            "requirements": len(self),
+            "ignored": self.ignored,
+            "libyear": round(total_days / 365.25, 2),
+            "percentiles": {
+                name: self.percentiles(name, percentiles=percentiles)
+                for name in NUMERIC_COLUMNS
+            },
+            "top": {
+                name: self.top(name, size=top)
+                for name in NUMERIC_COLUMNS
+            },
+            "pins": self.pin_distribution(),
+        }
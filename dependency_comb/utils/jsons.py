@@ -1,4 +1,6 @@
+import io
 import json
+import re
 import datetime
 
 from pathlib import Path
@@ -9,6 +11,55 @@ from packaging.markers import Marker
 
 from ..package import PackageRequirement
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Blank characters and separators between JSON list items
+LIST_SEPARATORS_REGEX = re.compile(r"[\s,]*")
+
+# Serializers for object types without native JSON support, indexed on their type
+JSON_SERIALIZERS = {
+    Path: str,
+    set: list,
+    tuple: list,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    Marker: str,
+    Requirement: str,
+    SpecifierSet: str,
+    Version: str,
+    PackageRequirement: PackageRequirement.json_data,
+    # Exceptions (like requirement parsing errors) to their message
+    Exception: str,
+}
+
+
+def json_default(obj):
+    """
+    Serialize an object which is not natively supported by JSON encoder.
+
+    Serializer is found from ``JSON_SERIALIZERS`` on the object type or else its
+    first parent class.
+
+    Arguments:
+        obj (object): Object to serialize.
+
+    Returns:
+        object: A JSON serializable object.
+    """
+    for klass in type(obj).__mro__:
+        serializer = JSON_SERIALIZERS.get(klass)
+        if serializer:
+            return serializer(obj)
+
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(type(obj).__name__)
+    )
+
 
 class ExtendedJsonEncoder(json.JSONEncoder):
     """
@@ -20,21 +71,156 @@ class ExtendedJsonEncoder(json.JSONEncoder):
 
     """
     def default(self, obj):
-        # Support for pathlib.Path to a string
-        if isinstance(obj, Path):
-            return str(obj)
-        # Support for set to a list
-        if isinstance(obj, set):
-            return list(obj)
-        # Support for datetime objects
-        if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
-            return obj.isoformat()
-        # Support for packaging objects
-        if isinstance(obj, (Marker, Requirement, SpecifierSet, Version)):
-            return str(obj)
-        # Support for dependency-comb objects
-        if isinstance(obj, PackageRequirement):
-            return obj.data()
-
-        # Let the base class default method raise the TypeError
-        return json.JSONEncoder.default(self, obj)
+        return json_default(obj)
+
+
+def json_loads(content):
+    """
+    Parse a JSON content.
+
+    It uses ``orjson`` when it is installed else the standard library.
+
+    Arguments:
+        content (string or bytes): JSON content to parse.
+
+    Returns:
+        object: Parsed content.
+    """
+    if orjson:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def json_dumps(obj, indent=None, fast=False):
+    """
+    Serialize an object to JSON with support of ``JSON_SERIALIZERS`` types.
+
+    Default mode uses the standard library and so its output is the same than with
+    ``json.dumps(..., cls=ExtendedJsonEncoder)``.
+
+    Arguments:
+        obj (object): Object to serialize.
+
+    Keyword Arguments:
+        indent (integer): Indentation level. Empty value means no indentation.
+        fast (boolean): If enabled and ``orjson`` is installed, it is used to
+            serialize object. Its output is compact without any spaces and an
+            indentation is always made with 2 spaces.
+
+    Returns:
+        string: Serialized JSON.
+    """
+    if fast and orjson:
+        # Non string keys are allowed and converted like the standard library does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(obj, default=json_default, option=option).decode("utf-8")
+
+    return json.dumps(obj, indent=indent, cls=ExtendedJsonEncoder)
+
+
+def iter_json_items(stream, chunk_size=65536):
+    """
+    Lazily parse JSON items from a stream.
+
+    Stream content can be either a JSON list which is incrementally parsed or
+    NDJSON (a JSON object per line). Format is detected from the first non blank
+    character.
+
+    Arguments:
+        stream (file object or string): Stream to read, a string is read from memory.
+
+    Keyword Arguments:
+        chunk_size (integer): Amount of characters to read at once when parsing a
+            JSON list.
+
+    Returns:
+        iterator: Iterator of parsed items.
+    """
+    if isinstance(stream, str):
+        stream = io.StringIO(stream)
+
+    # Search for the first non blank character to detect format
+    first = stream.read(1)
+    while first and first.isspace():
+        first = stream.read(1)
+
+    if not first:
+        return
+    elif first == "[":
+        yield from iter_json_list(stream, chunk_size=chunk_size)
+    else:
+        yield from iter_ndjson(stream, head=first)
+
+
+def iter_ndjson(stream, head=""):
+    """
+    Lazily parse NDJSON items from a stream.
+
+    Arguments:
+        stream (file object): Stream to read.
+
+    Keyword Arguments:
+        head (string): Already read content from the first line.
+
+    Returns:
+        iterator: Iterator of parsed items.
+    """
+    first_line = head + stream.readline()
+    if first_line.strip():
+        yield json_loads(first_line)
+
+    for line in stream:
+        if line.strip():
+            yield json_loads(line)
+
+
+def iter_json_list(stream, chunk_size=65536):
+    """
+    Incrementally parse items of a JSON list from a stream.
+
+    The list opening bracket is expected to have already been read from stream.
+
+    Arguments:
+        stream (file object): Stream to read.
+
+    Keyword Arguments:
+        chunk_size (integer): Amount of characters to read at once.
+
+    Returns:
+        iterator: Iterator of parsed items.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    while True:
+        # Skip blank characters and item separators
+        position = LIST_SEPARATORS_REGEX.match(buffer, position).end()
+
+        if buffer.startswith("]", position):
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            item, end = None, None
+
+        # Item could be incomplete if it ends the buffer, like a number
+        if end is None or (end == len(buffer) and not eof):
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                eof = True
+            # Drop already parsed content
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        yield item
+        position = end
@@ -0,0 +1,148 @@
+import io
+
+from ..exceptions import ManifestError
+from .jsons import iter_json_items, json_default
+from .. import __pkgname__
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Magic bytes starting a MessagePack manifest
+MSGPACK_MAGIC = b"DCMB"
+
+# Version of the manifest header and items structure
+MSGPACK_SCHEMA_VERSION = 1
+
+
+def is_msgpack_manifest(head):
+    """
+    Check if content starts like a MessagePack manifest.
+
+    Arguments:
+        head (bytes): Starting bytes of content.
+
+    Returns:
+        boolean: True if content starts with the manifest magic bytes.
+    """
+    return head[:len(MSGPACK_MAGIC)] == MSGPACK_MAGIC
+
+
+def get_msgpack():
+    """
+    Get the MessagePack library module.
+
+    Returns:
+        module: The ``msgpack`` module.
+
+    Raises:
+        ManifestError: If ``msgpack`` is not installed.
+    """
+    if msgpack is None:
+        raise ManifestError(
+            "MessagePack manifest requires the 'msgpack' package to be installed."
+        )
+
+    return msgpack
+
+
+def write_msgpack_manifest(items, stream):
+    """
+    Write items into a MessagePack manifest.
+
+    Manifest starts with the magic bytes and a header map with the schema version,
+    then each item is packed one after another and written as soon as it is
+    available.
+
+    Arguments:
+        items (iterable): Items to pack. Non native types are converted with
+            ``dependency_comb.utils.jsons.json_default()``.
+        stream (file object): Binary file object where to write manifest.
+
+    Returns:
+        integer: Amount of written items.
+    """
+    packer = get_msgpack().Packer(default=json_default)
+    count = 0
+
+    stream.write(MSGPACK_MAGIC)
+    stream.write(packer.pack({
+        "generator": __pkgname__,
+        "schema": MSGPACK_SCHEMA_VERSION,
+    }))
+
+    for item in items:
+        stream.write(packer.pack(item))
+        stream.flush()
+        count += 1
+
+    return count
+
+
+def iter_msgpack_items(stream):
+    """
+    Lazily unpack items from a MessagePack manifest.
+
+    Arguments:
+        stream (file object): Binary file object to read.
+
+    Returns:
+        iterator: Iterator of unpacked items.
+
+    Raises:
+        ManifestError: If ``msgpack`` is not installed, if manifest does not start
+            with the magic bytes or if its schema version is not supported.
+    """
+    unpacker_class = get_msgpack().Unpacker
+
+    if not is_msgpack_manifest(stream.read(len(MSGPACK_MAGIC))):
+        raise ManifestError("Invalid MessagePack manifest, magic bytes are missing.")
+
+    unpacker = unpacker_class(stream, raw=False)
+
+    header = next(unpacker, None)
+    if not isinstance(header, dict) or (
+        header.get("schema") != MSGPACK_SCHEMA_VERSION
+    ):
+        raise ManifestError(
+            "Unsupported MessagePack manifest header: {}".format(header)
+        )
+
+    yield from unpacker
+
+
+def iter_manifest_items(stream):
+    """
+    Lazily parse items from a binary stream either as a MessagePack manifest or
+    as JSON.
+
+    Format is detected from the magic bytes, every other content is parsed as JSON
+    with ``dependency_comb.utils.jsons.iter_json_items()``.
+
+    Arguments:
+        stream (file object): Binary file object to read.
+
+    Returns:
+        iterator: Iterator of parsed items.
+    """
+    # Peeking is required to detect format without to consume content
+    buffered = None
+    if not hasattr(stream, "peek"):
+        stream = buffered = io.BufferedReader(stream)
+
+    try:
+        if is_msgpack_manifest(stream.peek(len(MSGPACK_MAGIC))):
+            yield from iter_msgpack_items(stream)
+            return
+
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+        try:
+            yield from iter_json_items(text_stream)
+        finally:
+            text_stream.detach()
+    finally:
+        # Detach wrappers so they do not close the given stream
+        if buffered:
+            buffered.detach()
@@ -0,0 +1,119 @@
+import datetime
+import io
+import json
+from pathlib import Path
+
+import pytest
+from packaging.requirements import Requirement
+from packaging.version import Version
+
+from dependency_comb.package import PackageRelease
+from dependency_comb.utils.jsons import (
+    ExtendedJsonEncoder, iter_json_items, json_dumps, json_loads, orjson,
+)
+
+
+ITEMS = [
+    {"name": "foo", "lateness": [["1.0", "2024-01-01"]]},
+    {"name": "bar ] [", "lateness": None},
+    42,
+    "ping",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+def test_iter_json_items_list(chunk_size):
+    """
+    A JSON list should be incrementally parsed whatever the chunk size is.
+    """
+    stream = io.StringIO(json.dumps(ITEMS, indent=4))
+
+    assert list(iter_json_items(stream, chunk_size=chunk_size)) == ITEMS
+
+
+def test_iter_json_items_ndjson():
+    """
+    NDJSON should be parsed line by line, blank lines are ignored.
+    """
+    content = "\n" + "\n\n".join([json.dumps(item) for item in ITEMS]) + "\n"
+
+    assert list(iter_json_items(content)) == ITEMS
+    assert list(iter_json_items(io.StringIO(content))) == ITEMS
+
+
+@pytest.mark.parametrize("content", ["", "  \n", "[]", " [\n ] "])
+def test_iter_json_items_empty(content):
+    """
+    Empty content or empty list should not return any item.
+    """
+    assert list(iter_json_items(content)) == []
+
+
+@pytest.mark.parametrize("content", ["[1,", "[{\"foo\": ", "[1", "{\"foo\": "])
+def test_iter_json_items_invalid(content):
+    """
+    Invalid or incomplete content should raise a decoding error.
+    """
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_items(content))
+
+
+# Payload with every non native type
+EXTENDED_PAYLOAD = {
+    "path": Path("foo/bar.txt"),
+    "tags": {"ping"},
+    "release": PackageRelease(Version("1.0.0"), datetime.datetime(2024, 1, 2, 3, 4)),
+    "date": datetime.date(2024, 1, 2),
+    "requirement": Requirement("django>=3.2"),
+    "error": ValueError("Nope"),
+}
+
+EXTENDED_EXPECTED = {
+    "path": "foo/bar.txt",
+    "tags": ["ping"],
+    "release": ["1.0.0", "2024-01-02T03:04:00"],
+    "date": "2024-01-02",
+    "requirement": "django>=3.2",
+    "error": "Nope",
+}
+
+
+def test_json_dumps_default():
+    """
+    Default mode should have the same output than the standard library with the
+    extended encoder.
+    """
+    for indent in [None, 4]:
+        output = json_dumps(EXTENDED_PAYLOAD, indent=indent)
+
+        assert output == json.dumps(
+            EXTENDED_PAYLOAD, indent=indent, cls=ExtendedJsonEncoder
+        )
+        assert json_loads(output) == EXTENDED_EXPECTED
+
+
+def test_json_dumps_unsupported():
+    """
+    Unsupported objects should raise the usual error.
+    """
+    with pytest.raises(TypeError):
+        json_dumps({"foo": object()})
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+def test_json_dumps_fast():
+    """
+    Fast mode should serialize the same data than default mode.
+    """
+    output = json_dumps(EXTENDED_PAYLOAD, fast=True)
+
+    assert output.startswith('{"path":"foo/bar.txt",')
+    assert json_loads(output) == EXTENDED_EXPECTED
+    assert json_loads(json_dumps(EXTENDED_PAYLOAD, indent=4, fast=True)) == (
+        EXTENDED_EXPECTED
+    )
+
+    # Non string keys are converted like with the standard library
+    assert json_loads(json_dumps({50: 1, 99.5: 2}, fast=True)) == (
+        json_loads(json_dumps({50: 1, 99.5: 2}))
+    )
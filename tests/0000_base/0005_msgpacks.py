@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from dependency_comb.exceptions import ManifestError
+from dependency_comb.utils.msgpacks import (
+    MSGPACK_MAGIC, iter_manifest_items, iter_msgpack_items, msgpack,
+    write_msgpack_manifest,
+)
+
+
+# Skip marker decorator for tests depending on a msgpack installation
+msgpack_available = pytest.mark.skipif(
+    msgpack is None,
+    reason="msgpack is not installed"
+)
+
+
+ITEMS = [
+    {"name": "foo", "lateness": [["1.0", "2024-01-01"]], "extras": {"bar"}},
+    {"name": "bar", "lateness": None},
+]
+
+EXPECTED = [
+    {"name": "foo", "lateness": [["1.0", "2024-01-01"]], "extras": ["bar"]},
+    {"name": "bar", "lateness": None},
+]
+
+
+@msgpack_available
+def test_msgpack_manifest_roundtrip():
+    """
+    Written manifest should start with magic bytes and be unpacked to the same items
+    than with JSON.
+    """
+    stream = io.BytesIO()
+
+    assert write_msgpack_manifest(iter(ITEMS), stream) == 2
+    assert stream.getvalue().startswith(MSGPACK_MAGIC)
+
+    stream.seek(0)
+    assert list(iter_msgpack_items(stream)) == EXPECTED
+
+    # Format is detected from manifest items
+    stream.seek(0)
+    assert list(iter_manifest_items(stream)) == EXPECTED
+
+
+@msgpack_available
+@pytest.mark.parametrize("content, message", [
+    (b'[{"name": "foo"}]', "Invalid MessagePack manifest, magic bytes are missing."),
+    (MSGPACK_MAGIC, "Unsupported MessagePack manifest header: None"),
+])
+def test_msgpack_manifest_invalid(content, message):
+    """
+    Invalid manifest should raise a proper error.
+    """
+    with pytest.raises(ManifestError) as excinfo:
+        list(iter_msgpack_items(io.BytesIO(content)))
+
+    assert str(excinfo.value) == message
+
+
+def test_manifest_json_fallback():
+    """
+    Binary content without the magic bytes should be parsed as JSON and the stream
+    should not be closed.
+    """
+    stream = io.BytesIO(b'[{"name": "foo"}]')
+
+    assert list(iter_manifest_items(stream)) == [{"name": "foo"}]
+    assert stream.closed is False
+
+    stream = io.BytesIO('{"name": "é"}\n{"name": "bar"}\n'.encode("utf-8"))
+
+    assert list(iter_manifest_items(stream)) == [{"name": "é"}, {"name": "bar"}]
@@ -1,6 +1,17 @@
+import datetime
+import json
+
+import pytest
+
 from packaging.requirements import Requirement, SpecifierSet
+from packaging.version import Version
 
-from dependency_comb.package import PackageRequirement
+from dependency_comb.analyzer import DependenciesAnalyzer
+from dependency_comb.package import (
+    PackageRequirement, aggregate_age, get_days_behind, get_lateness_count,
+    parse_simple_requirement,
+)
+from dependency_comb.utils.jsons import ExtendedJsonEncoder
 
 
 def test_package_without_analyze():
@@ -26,5 +37,209 @@ def test_package_without_analyze():
         "url": None,
         "resolved_version": None,
         "resolved_published": None,
-        "parsing_error": None
+        "parsing_error": None,
+        "days_behind": None,
+        "libyear": None
+    }
+
+
+def test_package_slots():
+    """
+    Package object should not have an instance dictionnary and should refuse any
+    attribute that is not declared.
+    """
+    pkg = PackageRequirement("diskette>=0.1.0,<0.3.4")
+
+    assert hasattr(pkg, "__dict__") is False
+
+    with pytest.raises(AttributeError):
+        pkg.foo = "bar"
+
+
+def test_package_parsing_cache():
+    """
+    Identical source lines should be parsed once but each requirement should own its
+    mutable parts, invalid ones share the same error and marker evaluations should
+    still depend from environment.
+    """
+    first = PackageRequirement("diskette[foo]>=0.3.6")
+    second = PackageRequirement("diskette[foo]>=0.3.6")
+    assert first.parsed is not second.parsed
+    assert first.extras is not second.extras
+    assert first.specifier is not second.specifier
+
+    first.extras.add("bar")
+    first.specifier.prereleases = True
+    third = PackageRequirement("diskette[foo]>=0.3.6")
+    assert third.extras == second.extras == {"foo"}
+    assert first.specifier.prereleases is True
+    assert third.specifier.prereleases is second.specifier.prereleases is False
+    assert str(third.parsed) == "diskette[foo]>=0.3.6"
+
+    first = PackageRequirement("foo>1,foo<=2")
+    second = PackageRequirement("foo>1,foo<=2")
+    assert first.status == second.status == "invalid"
+    assert first.parsing_error is second.parsing_error
+
+    source = "bar ; os_name == \"linux\""
+    assert PackageRequirement(source, {"os_name": "linux"}).status == "parsed"
+    assert PackageRequirement(source, {"os_name": "nt"}).status == "marker-reject"
+    assert PackageRequirement(source, {"os_name": "linux"}).status == "parsed"
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("django", True),
+    ("Django==3.2.1", True),
+    ("zope.interface == 5.4.0", True),
+    ("foo_bar-baz==1.0.0rc1+local.7", True),
+    ("django>=1.11,<1.12", False),
+    ("django==1.11.*", False),
+    ("django[argon2]==4.2", False),
+    ("django==4.2 ; python_version < \"3.8\"", False),
+    ("urllib3 @ https://github.com/urllib3/urllib3/archive/1.26.8.zip", False),
+    ("django==nope-", False),
+    ("-django", False),
+])
+def test_parse_simple_requirement(source, expected):
+    """
+    Fast path parser should only accept simple requirement lines and produce the same
+    requirement than the full parser.
+    """
+    requirement = parse_simple_requirement(source)
+
+    assert (requirement is not None) is expected
+
+    if expected:
+        reference = Requirement(source)
+        assert requirement == reference
+        assert str(requirement) == str(reference)
+        assert requirement.name == reference.name
+        assert requirement.extras == reference.extras
+        assert requirement.url == reference.url
+        assert requirement.marker == reference.marker
+
+
+def test_package_json_data(settings):
+    """
+    JSON data should be serialized without any specific encoder to the same JSON
+    than the data serialized with the extended encoder.
+    """
+    analyzer = DependenciesAnalyzer(
+        cachedir=settings.fixtures_path / "api_cache",
+        api_pause=None,
+    )
+    packages = list(analyzer.inspect(
+        (settings.fixtures_path / "pip_syntax/requirements.txt").read_text(),
+        environment={"python_version": "3.10"},
+        strict=False,
+    ))
+    packages.append(PackageRequirement("django[argon2]>=3.2; python_version < '3'"))
+    packages.append(PackageRequirement("foo>>>1"))
+
+    assert len(set([pkg.status for pkg in packages])) > 2
+
+    for pkg in packages:
+        assert json.dumps(pkg.json_data()) == json.dumps(
+            pkg.data(), cls=ExtendedJsonEncoder
+        )
+
+
+def test_package_json_data_equal_versions():
+    """
+    Equal versions and specifiers with a different string form should keep their
+    own form when serialized in the same process.
+    """
+    short = PackageRequirement("foo==2.0")
+    long = PackageRequirement("bar==2.0.0")
+    short.resolved_version = Version("2.0")
+    long.resolved_version = Version("2.0.0")
+
+    assert short.json_data()["specifier"] == "==2.0"
+    assert short.json_data()["resolved_version"] == "2.0"
+    assert long.json_data()["specifier"] == "==2.0.0"
+    assert long.json_data()["resolved_version"] == "2.0.0"
+
+    for pkg in (short, long):
+        assert json.dumps(pkg.json_data()) == json.dumps(
+            pkg.data(), cls=ExtendedJsonEncoder
+        )
+
+
+def test_package_lateness_summary(settings):
+    """
+    Lateness summary should contain the amount of missed releases, the oldest and
+    newest ones and the libyear value.
+    """
+    analyzer = DependenciesAnalyzer(
+        cachedir=settings.fixtures_path / "api_cache",
+        api_pause=None,
+    )
+    django, urllib3, diskette = analyzer.inspect(
+        "django==3.2.1\nurllib3\ndiskette>=0.1.0,<0.3.4",
+        strict=False,
+    )
+
+    assert django.lateness_summary() == {
+        "count": 79,
+        "oldest": ["3.2.2", "2021-05-06T07:40:03"],
+        "newest": ["5.1.2", "2024-10-08T14:53:12"],
+        "libyear": 3.43,
+    }
+    assert diskette.json_data(lateness_summary=True)["lateness"] == {
+        "count": 3,
+        "oldest": ["0.3.4", "2024-03-30T12:38:29"],
+        "newest": ["0.3.6", "2024-09-01T20:01:50"],
+        "libyear": 0.43,
     }
+    assert urllib3.lateness_summary() is None
+
+    assert get_lateness_count(django.lateness) == 79
+    assert get_lateness_count(django.lateness_summary()) == 79
+    assert get_lateness_count(urllib3.lateness) is None
+
+
+def test_package_aggregate_age(settings):
+    """
+    Age metrics should be summed from requirement objects or their data.
+    """
+    analyzer = DependenciesAnalyzer(
+        cachedir=settings.fixtures_path / "api_cache",
+        api_pause=None,
+    )
+    packages = list(analyzer.inspect(
+        "django==3.2.1\nurllib3\ndiskette>=0.1.0,<0.3.4\n-e .",
+        strict=False,
+    ))
+
+    assert [pkg.days_behind for pkg in packages] == [1253, None, 157, None]
+
+    expected = {"packages": 2, "days_behind": 1410, "libyear": 3.86}
+    assert aggregate_age(packages) == expected
+    assert aggregate_age([pkg.json_data() for pkg in packages]) == expected
+    assert aggregate_age([]) == {"packages": 0, "days_behind": 0, "libyear": 0.0}
+
+
+@pytest.mark.parametrize("item, expected", [
+    ({"days_behind": 42}, 42),
+    (
+        {
+            "resolved_published": "2021-05-04T08:48:26",
+            "highest_published": "2024-10-08T14:53:12.755859Z",
+        },
+        1253,
+    ),
+    (
+        {
+            "resolved_published": datetime.datetime(2021, 5, 4, 8, 48, 26),
+            "highest_published": datetime.datetime(2024, 10, 8, 14, 53, 12),
+        },
+        1253,
+    ),
+    ({"resolved_published": None, "highest_published": "2024-10-08T14:53:12"}, 0),
+])
+def test_get_days_behind(item, expected):
+    """
+    Days behind should be taken from data or computed from release dates for
+    manifests without it.
+    """
+    assert get_days_behind(item) == expected
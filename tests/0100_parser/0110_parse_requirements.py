@@ -1,3 +1,4 @@
+import os
 import json
 
 import pytest
@@ -79,7 +80,9 @@ def test_parse_markers(settings):
             "url": None,
             "resolved_version": None,
             "resolved_published": None,
-            "parsing_error": None
+            "parsing_error": None,
+            "days_behind": None,
+            "libyear": None
         },
         {
             "extras": [],
@@ -97,7 +100,9 @@ def test_parse_markers(settings):
             "url": None,
             "resolved_version": None,
             "resolved_published": None,
-            "parsing_error": None
+            "parsing_error": None,
+            "days_behind": None,
+            "libyear": None
         },
         {
             "extras": [],
@@ -115,7 +120,9 @@ def test_parse_markers(settings):
             "url": None,
             "resolved_version": None,
             "resolved_published": None,
-            "parsing_error": None
+            "parsing_error": None,
+            "days_behind": None,
+            "libyear": None
         },
         {
             "extras": [],
@@ -133,7 +140,9 @@ def test_parse_markers(settings):
             "url": None,
             "resolved_version": None,
             "resolved_published": None,
-            "parsing_error": None
+            "parsing_error": None,
+            "days_behind": None,
+            "libyear": None
         }
     ]
 
@@ -169,6 +178,8 @@ def test_parse_inclusion_directive(settings):
             "status": "parsed",
             "url": None,
             "parsing_error": None,
+            "days_behind": None,
+            "libyear": None,
         },
         {
             "extras": set(),
@@ -187,6 +198,8 @@ def test_parse_inclusion_directive(settings):
             "status": "parsed",
             "url": None,
             "parsing_error": None,
+            "days_behind": None,
+            "libyear": None,
         },
         {
             "extras": set(),
@@ -205,6 +218,8 @@ def test_parse_inclusion_directive(settings):
             "status": "parsed",
             "url": None,
             "parsing_error": None,
+            "days_behind": None,
+            "libyear": None,
         },
         {
             "extras": set(),
@@ -223,6 +238,8 @@ def test_parse_inclusion_directive(settings):
             "status": "parsed",
             "url": None,
             "parsing_error": None,
+            "days_behind": None,
+            "libyear": None,
         },
     ]
 
@@ -245,3 +262,169 @@ def test_parse_inclusion_directive_notfound(settings):
     assert str(excinfo.value) == (
         "Unable to find included source: {}".format(included_source)
     )
+
+
+def test_iter_requirements_lazy(settings):
+    """
+    Requirements should be yielded as soon as their line has been read and inclusions
+    should be resolved when reached.
+    """
+    consumed = []
+
+    def lines():
+        for line in ["diskette\n", "-r dev.txt\n", "boussole\n"]:
+            consumed.append(line)
+            yield line
+
+    parser = RequirementParser()
+    results = parser.iter_requirements(
+        lines(),
+        basepath=settings.fixtures_path / "nested_requirements",
+    )
+
+    assert next(results).name == "diskette"
+    assert consumed == ["diskette\n"]
+
+    assert [pkg.name for pkg in results] == [
+        "diskette", "boussole", "boussole",
+    ]
+    assert len(consumed) == 3
+
+
+def test_iter_requirements_file_object(settings):
+    """
+    Parser should accept an opened file object and give the same results than with
+    its path.
+    """
+    sample_source = settings.fixtures_path / "nested_requirements/base.txt"
+    basepath = settings.fixtures_path / "nested_requirements"
+    parser = RequirementParser()
+
+    with sample_source.open() as fp:
+        from_file = [
+            pkg.data()
+            for pkg in parser.iter_requirements(fp, basepath=basepath)
+        ]
+
+    assert from_file == [
+        pkg.data()
+        for pkg in parser.parse_requirements(sample_source, basepath=basepath)
+    ]
+
+
+def test_parse_inclusion_circular(tmp_path):
+    """
+    A RequirementParserError exception should be raised with the inclusion chain when
+    a circular inclusion is detected.
+    """
+    base = tmp_path / "base.txt"
+    base.write_text("django\n-r dev.txt\n")
+    dev = tmp_path / "dev.txt"
+    dev.write_text("diskette\n-r base.txt\n")
+    parser = RequirementParser()
+
+    with pytest.raises(RequirementParserError) as excinfo:
+        parser.parse_requirements(base, basepath=tmp_path)
+
+    assert str(excinfo.value) == "Circular inclusion detected: {} -> {} -> {}".format(
+        base, dev, base
+    )
+
+
+def test_parse_inclusion_cache(tmp_path):
+    """
+    An included file should be parsed only once and its results reused for every
+    other inclusion until the file is modified.
+    """
+    (tmp_path / "common.txt").write_text("django\n")
+    (tmp_path / "dev.txt").write_text("-r common.txt\ndiskette\n")
+    (tmp_path / "test.txt").write_text("-r common.txt\npytest\n")
+    content = "-r dev.txt\n-r test.txt\n"
+    parser = RequirementParser()
+
+    results = parser.parse_requirements(content, basepath=tmp_path)
+
+    assert [pkg.name for pkg in results] == ["django", "diskette", "django", "pytest"]
+    # Shared inclusion results are new objects since analyzer modifies them
+    assert results[0] is not results[2]
+    assert results[0].source == results[2].source
+    assert len(parser.inclusion_cache) == 3
+    assert parser.inclusion_graph == {
+        None: [tmp_path / "dev.txt", tmp_path / "test.txt"],
+        tmp_path / "dev.txt": [tmp_path / "common.txt"],
+        tmp_path / "test.txt": [tmp_path / "common.txt"],
+        tmp_path / "common.txt": [],
+    }
+
+    # A modified file is parsed again
+    common = tmp_path / "common.txt"
+    common.write_text("boussole\n")
+    mtime = common.stat().st_mtime_ns + 1000000000
+    os.utime(common, ns=(mtime, mtime))
+
+    results = parser.parse_requirements(content, basepath=tmp_path)
+
+    assert [pkg.name for pkg in results] == [
+        "boussole", "diskette", "boussole", "pytest"
+    ]
+
+
+def test_parse_lock_file(settings):
+    """
+    Parser should join continued lines and remove hash options so lock files only
+    result to their requirements.
+    """
+    sample_source = settings.fixtures_path / "lock_requirements/requirements.txt"
+    parser = RequirementParser()
+
+    results = parser.parse_requirements(sample_source)
+
+    assert [(pkg.source, pkg.status) for pkg in results] == [
+        ("certifi==2024.8.30", "parsed"),
+        ("charset-normalizer==3.4.0", "parsed"),
+        ("idna==3.10", "parsed"),
+        ("requests==2.32.3", "parsed"),
+        ("urllib3==2.2.3", "parsed"),
+    ]
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("foo==1.0", ["foo==1.0"]),
+    ("foo==1.0 \\\n  --hash=sha256:abc", ["foo==1.0"]),
+    ("foo==1.0 --hash sha256:abc --hash=sha256:def", ["foo==1.0"]),
+    ("foo>=1.0,\\\n<2.0\nbar", ["foo>=1.0, <2.0", "bar"]),
+    ("# comment \\\nfoo", ["# comment \\", "foo"]),
+    ("foo==1.0 \\", ["foo==1.0"]),
+    ("--hash=sha256:abc", [""]),
+])
+def test_iter_logical_lines(source, expected):
+    """
+    Continued lines should be joined and hash options removed.
+    """
+    parser = RequirementParser()
+
+    assert list(parser.iter_logical_lines(source)) == expected
+
+
+def test_parse_inclusion_cache_removed(tmp_path):
+    """
+    A removed inclusion should not be involved anymore in cache validation.
+    """
+    (tmp_path / "a.txt").write_text("-r b.txt\ndjango\n")
+    (tmp_path / "b.txt").write_text("-r c.txt\ndiskette\n")
+    (tmp_path / "c.txt").write_text("pytest\n")
+    content = "-r a.txt\n"
+    parser = RequirementParser()
+
+    results = parser.parse_requirements(content, basepath=tmp_path)
+    assert [pkg.name for pkg in results] == ["pytest", "diskette", "django"]
+
+    b = tmp_path / "b.txt"
+    b.write_text("diskette\n")
+    mtime = b.stat().st_mtime_ns + 1000000000
+    os.utime(b, ns=(mtime, mtime))
+    (tmp_path / "c.txt").unlink()
+
+    results = parser.parse_requirements(content, basepath=tmp_path)
+    assert [pkg.name for pkg in results] == ["diskette", "django"]
+    assert parser.inclusion_graph[b] == []
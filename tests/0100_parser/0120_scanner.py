@@ -0,0 +1,68 @@
+from dependency_comb.scanner import RequirementScanner
+
+
+def build_tree(basedir, paths):
+    """
+    Create empty files for given relative paths.
+    """
+    for path in paths:
+        path = basedir / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+
+def test_scan_default(tmp_path):
+    """
+    Scanner should find requirement files with default patterns and ignore default
+    directories.
+    """
+    build_tree(tmp_path, [
+        "requirements.txt",
+        "README.rst",
+        "foo/requirements-dev.txt",
+        "foo/setup.py",
+        "foo/requirements/base.txt",
+        "foo/requirements/README.rst",
+        "bar/baz/requirements.txt",
+        ".venv/lib/requirements.txt",
+        "bar/node_modules/requirements.txt",
+    ])
+
+    scanner = RequirementScanner()
+
+    assert [
+        item.relative_to(tmp_path).as_posix()
+        for item in scanner.scan(tmp_path)
+    ] == [
+        "bar/baz/requirements.txt",
+        "foo/requirements/base.txt",
+        "foo/requirements-dev.txt",
+        "requirements.txt",
+    ]
+
+
+def test_scan_options(tmp_path):
+    """
+    Scanner should use given patterns and ignores.
+    """
+    build_tree(tmp_path, [
+        "requirements.txt",
+        "foo/deps.txt",
+        "foo/tests/deps.txt",
+        "bar/deps.txt",
+        ".venv/deps.txt",
+    ])
+
+    scanner = RequirementScanner(
+        patterns=["deps.txt"],
+        ignores=["foo/tests", "bar"],
+        workers=1,
+    )
+
+    assert [
+        item.relative_to(tmp_path).as_posix()
+        for item in scanner.scan(tmp_path)
+    ] == [
+        ".venv/deps.txt",
+        "foo/deps.txt",
+    ]
@@ -1,6 +1,10 @@
+import datetime
+
+import pytest
 from packaging.version import Version
 
 from dependency_comb.analyzer import DependenciesAnalyzer
+from dependency_comb.package import PackageRelease
 
 
 def test_compute_lateness(settings):
@@ -13,13 +17,40 @@ def test_compute_lateness(settings):
     analyzer = DependenciesAnalyzer(cachedir=cachedir)
 
     versions = [
-        {"number": Version("1.0.0"), "published_at": "evening"},
-        {"number": Version("0.3.3"), "published_at": "noon"},
-        {"number": Version("0.0.1"), "published_at": "morning"},
-        {"number": Version("0.3.5"), "published_at": "afternoon"},
-        {"number": Version("0.3.4"), "published_at": "afternoon"},
+        PackageRelease(Version("1.0.0"), "evening"),
+        PackageRelease(Version("0.3.3"), "noon"),
+        PackageRelease(Version("0.0.1"), "morning"),
+        PackageRelease(Version("0.3.5"), "afternoon"),
+        PackageRelease(Version("0.3.4"), "afternoon"),
     ]
 
     informations = analyzer.compute_lateness(target="0.3.4", versions=versions)
 
     assert informations == [("1.0.0", "evening"), ("0.3.5", "afternoon")]
+
+
+@pytest.mark.parametrize("resolved, highest, expected", [
+    (
+        datetime.datetime(2021, 5, 4, 8, 48, 26),
+        datetime.datetime(2024, 10, 8, 14, 53, 12),
+        (1253, 3.43),
+    ),
+    (
+        datetime.datetime(2024, 10, 8, 14, 53, 12),
+        datetime.datetime(2024, 10, 8, 14, 53, 12),
+        (0, 0.0),
+    ),
+    # A maintenance release published after the highest release is not behind
+    (
+        datetime.datetime(2024, 10, 9, 0, 0, 0),
+        datetime.datetime(2024, 10, 8, 14, 53, 12),
+        (0, 0.0),
+    ),
+])
+def test_compute_age(resolved, highest, expected):
+    """
+    Age should be the days between resolved and highest releases and its libyear.
+    """
+    analyzer = DependenciesAnalyzer()
+
+    assert analyzer.compute_age(resolved, highest) == expected
@@ -6,16 +6,16 @@ from packaging.requirements import Requirement, SpecifierSet
 from packaging.version import Version
 
 from dependency_comb.analyzer import DependenciesAnalyzer
-from dependency_comb.package import PackageRequirement
+from dependency_comb.package import PackageRelease, PackageRequirement
 
 
 @pytest.mark.parametrize("source, expected", [
     (
         "diskette>=0.1.0,<0.3.4",
-        {
-            "number": Version("0.3.3"),
-            "published_at": datetime.datetime(2024, 3, 28, 15, 46, 54),
-        }
+        PackageRelease(
+            Version("0.3.3"),
+            datetime.datetime(2024, 3, 28, 15, 46, 54),
+        )
     ),
     (
         "diskette>=2.0.0",
@@ -23,10 +23,10 @@ from dependency_comb.package import PackageRequirement
     ),
     (
         "diskette",
-        {
-            "number": Version("0.3.6"),
-            "published_at": datetime.datetime(2024, 9, 1, 20, 1, 50),
-        }
+        PackageRelease(
+            Version("0.3.6"),
+            datetime.datetime(2024, 9, 1, 20, 1, 50),
+        )
     )
 ])
 def test_get_latest_specified_release(settings, source, expected):
@@ -83,7 +83,9 @@ def test_build_package_informations_with_requirement(settings):
         "url": None,
         "resolved_version": Version("0.3.3"),
         "resolved_published": datetime.datetime(2024, 3, 28, 15, 46, 54),
-        "parsing_error": None
+        "parsing_error": None,
+        "days_behind": 157,
+        "libyear": 0.43
     }
 
 
@@ -119,7 +121,9 @@ def test_build_package_informations_without_requirement(settings):
         "url": None,
         "resolved_version": None,
         "resolved_published": None,
-        "parsing_error": None
+        "parsing_error": None,
+        "days_behind": None,
+        "libyear": None
     }
 
 
@@ -150,7 +154,9 @@ def test_build_package_informations_with_exceed_requirement(settings):
         "url": None,
         "resolved_version": None,
         "resolved_published": None,
-        "parsing_error": None
+        "parsing_error": None,
+        "days_behind": None,
+        "libyear": None
     }
 
 
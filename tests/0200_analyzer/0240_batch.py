@@ -0,0 +1,71 @@
+import logging
+
+from dependency_comb import __pkgname__
+from dependency_comb.analyzer import DependenciesAnalyzer
+from dependency_comb.package import PackageRequirement
+from dependency_comb.utils.logger import LoggerBase
+
+
+def test_build_fetch_plan():
+    """
+    Fetch plan should only contains unique package names from parsed requirements.
+    """
+    analyzer = DependenciesAnalyzer()
+
+    plan = analyzer.build_fetch_plan([
+        PackageRequirement("django==3.2.1"),
+        PackageRequirement("-r dev.txt"),
+        PackageRequirement("diskette"),
+        PackageRequirement("Django>=4.0"),
+        PackageRequirement("foo>1,foo<=2"),
+    ])
+
+    assert plan == ["django", "diskette"]
+
+
+def test_inspect_batch(caplog, settings, tmp_path):
+    """
+    Batch inspection should fetch each package once and return requirements for each
+    source.
+    """
+    caplog.set_level(logging.INFO)
+
+    first = tmp_path / "first.txt"
+    first.write_text("django==3.2.1\ndiskette\n")
+    second = tmp_path / "second.txt"
+    second.write_text("diskette>=0.1.0,<0.3.4\n-e .\ndjango>=1.11,<1.12\n")
+
+    analyzer = DependenciesAnalyzer(
+        cachedir=settings.fixtures_path / "api_cache",
+        api_pause=None,
+        logger=LoggerBase().log,
+    )
+
+    results = [
+        (source, [(pkg.name, pkg.status, str(pkg.resolved_version)) for pkg in pkgs])
+        for source, pkgs in analyzer.inspect_batch([first, second])
+    ]
+
+    assert results == [
+        (
+            first,
+            [
+                ("django", "analyzed", "3.2.1"),
+                ("diskette", "analyzed", "None"),
+            ]
+        ),
+        (
+            second,
+            [
+                ("diskette", "analyzed", "0.3.3"),
+                (None, "unsupported-argument", "None"),
+                ("django", "analyzed", "1.11.9"),
+            ]
+        ),
+    ]
+
+    assert caplog.record_tuples == [
+        (__pkgname__, 20, "Fetch plan for 2 source(s): 2 package(s)"),
+        (__pkgname__, 20, "Processing package: django"),
+        (__pkgname__, 20, "Processing package: diskette"),
+    ]
@@ -0,0 +1,56 @@
+from dependency_comb.analyzer import DependenciesAnalyzer
+from dependency_comb.package import PackageRequirement
+
+
+def test_evaluate_environment():
+    """
+    Requirement status for an environment should only depend from marker evaluation.
+    """
+    pkg = PackageRequirement("bar ; os_name == \"linux\"")
+
+    assert pkg.evaluate_environment({"os_name": "linux"}) == "parsed"
+    assert pkg.evaluate_environment({"os_name": "nt"}) == "marker-reject"
+    assert pkg.evaluate_environment({}) == "parsed"
+    assert pkg.evaluate_environment(None) == "parsed"
+
+    # Invalid requirement keep their status
+    pkg = PackageRequirement("-r dev.txt")
+    assert pkg.evaluate_environment({"os_name": "nt"}) == "unsupported-argument"
+
+
+def test_build_environment_matrix(settings):
+    """
+    Matrix should give status and lateness for each environment from a single
+    analyze.
+    """
+    analyzer = DependenciesAnalyzer(cachedir=settings.fixtures_path / "api_cache")
+    environments = {
+        "py27": {"python_version": "2.7"},
+        "py311": {"python_version": "3.11"},
+    }
+
+    results = {
+        pkg.source: analyzer.build_environment_matrix(pkg, environments)
+        for pkg in analyzer.inspect(
+            (
+                "diskette>=0.1.0,<0.3.4\n"
+                "django ; python_version >= \"3.0\"\n"
+                "-r dev.txt\n"
+            )
+        )
+    }
+
+    assert results == {
+        "diskette>=0.1.0,<0.3.4": {
+            "py27": {"status": "analyzed", "lateness": 3},
+            "py311": {"status": "analyzed", "lateness": 3},
+        },
+        "django ; python_version >= \"3.0\"": {
+            "py27": {"status": "marker-reject", "lateness": None},
+            "py311": {"status": "analyzed", "lateness": None},
+        },
+        "-r dev.txt": {
+            "py27": {"status": "unsupported-argument", "lateness": None},
+            "py311": {"status": "unsupported-argument", "lateness": None},
+        },
+    }
@@ -0,0 +1,244 @@
+import io
+import json
+
+import pytest
+
+from dependency_comb import stats
+from dependency_comb.stats import FleetStatistics
+from dependency_comb.utils.msgpacks import msgpack, write_msgpack_manifest
+
+
+def make_item(name, version=None, lateness=None, days=None, status="analyzed"):
+    """
+    Shortcut to build a requirement item like in manifests.
+    """
+    return {
+        "name": name,
+        "status": status,
+        "resolved_version": version,
+        "lateness": lateness,
+        "days_behind": days,
+    }
+
+
+PROJECT_A = [
+    make_item("django", "4.2.1", {"count": 12}, 400),
+    make_item("requests", "2.8.1", [["2.9.0", "x"], ["2.10.0", "x"]], 900),
+    make_item("urllib3"),
+    make_item(None, status="unsupported-url"),
+]
+
+PROJECT_B = [
+    make_item("django", "4.2.1", {"count": 12}, 400),
+    make_item("django-admin-shortcuts", "1.2.6", {"count": 3}, 3402),
+    make_item("requests", "2.32.0", [], 0),
+]
+
+
+@pytest.fixture(params=["numpy", "stdlib"])
+def backend(request, monkeypatch):
+    """
+    Run a test with numpy and without it, both should give the same results.
+    """
+    if request.param == "numpy":
+        if stats.numpy is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(stats, "numpy", None)
+
+    return request.param
+
+
+def test_add_items():
+    """
+    Only analyzed requirements should be loaded into columns.
+    """
+    statistics = FleetStatistics()
+
+    assert statistics.add_items(PROJECT_A, "a") == 3
+    assert statistics.add_items(PROJECT_B, "b") == 3
+
+    assert len(statistics) == 6
+    assert statistics.ignored == 1
+    assert statistics.projects == ["a", "b"]
+    assert list(statistics.project_indexes) == [0, 0, 0, 1, 1, 1]
+    assert list(statistics.lateness) == [12, 2, 0, 12, 3, 0]
+    assert list(statistics.days_behind) == [400, 900, 0, 400, 3402, 0]
+
+
+@pytest.mark.parametrize("percentiles, expected", [
+    (None, {50: 400.0, 90: 2151.0, 99: 3276.9}),
+    ([0, 25, 100], {0: 0.0, 25: 100.0, 100: 3402.0}),
+    ([33.3], {33.3: 266.0}),
+])
+def test_percentiles(backend, percentiles, expected):
+    """
+    Percentiles should be interpolated the same way with or without numpy.
+    """
+    statistics = FleetStatistics()
+    statistics.add_items(PROJECT_A, "a")
+    statistics.add_items(PROJECT_B, "b")
+
+    assert statistics.percentiles("days_behind", percentiles=percentiles) == expected
+
+
+def test_percentiles_empty(backend):
+    """
+    Percentiles should be null when there is no requirements.
+    """
+    assert FleetStatistics().percentiles("lateness", [50]) == {50: None}
+
+
+def test_unknown_column():
+    """
+    Only numeric columns can be used.
+    """
+    with pytest.raises(ValueError):
+        FleetStatistics().percentiles("name")
+
+
+def test_top(backend):
+    """
+    Top should return the highest values and keep loading order for equal values.
+    """
+    statistics = FleetStatistics()
+    statistics.add_items(PROJECT_A, "a")
+    statistics.add_items(PROJECT_B, "b")
+
+    assert statistics.top("lateness", size=3) == [
+        {"name": "django", "project": "a", "version": "4.2.1", "lateness": 12},
+        {"name": "django", "project": "b", "version": "4.2.1", "lateness": 12},
+        {
+            "name": "django-admin-shortcuts",
+            "project": "b",
+            "version": "1.2.6",
+            "lateness": 3,
+        },
+    ]
+
+    assert len(statistics.top("days_behind", size=100)) == 6
+    assert statistics.top("days_behind", size=0) == []
+
+    with pytest.raises(ValueError):
+        statistics.top("lateness", size=-1)
+
+
+def test_pin_distribution():
+    """
+    Resolved versions should be counted per package.
+    """
+    statistics = FleetStatistics()
+    statistics.add_items(PROJECT_A, "a")
+    statistics.add_items(PROJECT_B, "b")
+
+    assert statistics.pin_distribution() == {
+        "django": {"4.2.1": 2},
+        "django-admin-shortcuts": {"1.2.6": 1},
+        "requests": {"2.8.1": 1, "2.32.0": 1},
+        "urllib3": {"latest": 1},
+    }
+
+
+def test_add_manifest_json(tmp_path):
+    """
+    Analyze manifests should be loaded as a project and aggregated manifests as
+    many projects, whatever is the JSON format.
+    """
+    analyze = tmp_path / "analyze.json"
+    analyze.write_text(json.dumps(PROJECT_A, indent=4))
+
+    ndjson = tmp_path / "analyze.ndjson"
+    ndjson.write_text("\n".join([json.dumps(item) for item in PROJECT_B]))
+
+    aggregated = tmp_path / "manifest.json"
+    aggregated.write_text(json.dumps({"a": PROJECT_A, "b": PROJECT_B}, indent=4))
+
+    statistics = FleetStatistics()
+
+    assert statistics.add_manifest(analyze) == 3
+    assert statistics.add_manifest(ndjson) == 3
+    assert statistics.add_manifest(aggregated) == 6
+
+    assert statistics.projects == [str(analyze), str(ndjson), "a", "b"]
+    assert len(statistics) == 12
+
+
+def test_add_manifest_incremental(monkeypatch, tmp_path):
+    """
+    JSON list and NDJSON manifests should be incrementally parsed and only
+    aggregated manifests parsed at once, even on a single line.
+    """
+    analyze = tmp_path / "analyze.json"
+    analyze.write_text(json.dumps(PROJECT_A, indent=4))
+
+    ndjson = tmp_path / "analyze.ndjson"
+    ndjson.write_text("\n".join([json.dumps(item) for item in PROJECT_B]))
+
+    aggregated = tmp_path / "manifest.json"
+    aggregated.write_text("\n  " + json.dumps({"a": PROJECT_A, "b": PROJECT_B}))
+
+    loaded = []
+
+    def spy_json_loads(content):
+        loaded.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(stats, "json_loads", spy_json_loads)
+
+    statistics = FleetStatistics()
+
+    assert statistics.add_manifest(analyze) == 3
+    assert loaded == []
+
+    # Only the first NDJSON line is parsed to detect format
+    assert statistics.add_manifest(ndjson) == 3
+    assert loaded == [json.dumps(PROJECT_B[0]) + "\n"]
+
+    assert statistics.add_manifest(aggregated) == 6
+    assert statistics.projects == [str(analyze), str(ndjson), "a", "b"]
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")
+def test_add_manifest_msgpack(tmp_path):
+    """
+    MessagePack manifest should be loaded as a project.
+    """
+    stream = io.BytesIO()
+    write_msgpack_manifest(PROJECT_A, stream)
+
+    manifest = tmp_path / "analyze.msgpack"
+    manifest.write_bytes(stream.getvalue())
+
+    statistics = FleetStatistics()
+
+    assert statistics.add_manifest(manifest) == 3
+    assert statistics.projects == [str(manifest)]
+
+
+def test_summary(backend):
+    """
+    Summary should contains every statistics.
+    """
+    statistics = FleetStatistics()
+    statistics.add_items(PROJECT_A, "a")
+    statistics.add_items(PROJECT_B, "b")
+
+    summary = statistics.summary(percentiles=[50], top=1)
+
+    assert summary["projects"] == 2
+    assert summary["requirements"] == 6
+    assert summary["ignored"] == 1
+    assert summary["libyear"] == 13.97
+    assert summary["percentiles"] == {
+        "lateness": {50: 2.5},
+        "days_behind": {50: 400.0},
+    }
+    assert summary["top"]["days_behind"] == [
+        {
+            "name": "django-admin-shortcuts",
+            "project": "b",
+            "version": "1.2.6",
+            "days_behind": 3402,
+        },
+    ]
+    assert summary["pins"] == statistics.pin_distribution()
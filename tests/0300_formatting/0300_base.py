@@ -1,20 +1,26 @@
 import json
 
+import pytest
+
 from freezegun import freeze_time
 
-from dependency_comb.formatting import BaseFormatter
+from dependency_comb.analyzer import DependenciesAnalyzer
+from dependency_comb.formatting import (
+    BaseFormatter, CSVFormatter, JSONFormatter, ReportModel,
+    RestructuredTextFormatter,
+)
+from dependency_comb.utils.jsons import ExtendedJsonEncoder
 
 
 @freeze_time("2024-07-25 10:00:00")
-def test_base_build_analyzed_table(settings):
+def test_base_build_report_analyzed(settings):
     """
-    Method should build a list of dictionnaries for all items with status 'analyzed'.
+    Report should have a row dictionnary for all items with status 'analyzed'.
     """
     analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
-    analyze_content = json.loads(analyze.read_text())
     formatter = BaseFormatter()
 
-    output = formatter.build_analyzed_table(analyze_content)
+    output = formatter.build_report(analyze).analyzed
     assert output == [
         {
             "key": 1,
@@ -80,16 +86,15 @@ def test_base_build_analyzed_table(settings):
 
 
 @freeze_time("2024-07-25 10:00:00")
-def test_base_build_errors_table(settings):
+def test_base_build_report_failures(settings):
     """
-    Method should build a list of dictionnaries for all items except the ones with
-    status 'analyzed'.
+    Report should have a row dictionnary for all items except the ones with status
+    'analyzed'.
     """
     analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
-    analyze_content = json.loads(analyze.read_text())
     formatter = BaseFormatter()
 
-    output = formatter.build_errors_table(analyze_content)
+    output = formatter.build_report(analyze).failures
     assert output == [
         {
             "key": 1,
@@ -347,3 +352,147 @@ def test_base_write(settings, tmp_path):
             "resume": "Direct package URL is not supported"
         }
     ]
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_base_native_requirements(settings):
+    """
+    Formatter should directly accept requirement objects and build the same tables
+    than from their JSON serialization.
+    """
+    analyzer = DependenciesAnalyzer(cachedir=settings.fixtures_path / "api_cache")
+    packages = list(analyzer.inspect(
+        settings.fixtures_path / "pip_syntax/requirements.txt"
+    ))
+    packages += list(analyzer.inspect("foo>1,foo<=2"))
+    serialized = json.dumps(packages, cls=ExtendedJsonEncoder)
+    formatter = BaseFormatter()
+
+    native = formatter.build_report(packages)
+    report = formatter.build_report(serialized)
+
+    assert native.analyzed == report.analyzed
+    assert native.failures == report.failures
+    assert native.failures[-1]["status"] == "invalid"
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_base_build_report(settings):
+    """
+    Report model can be given as is to formatters and table shortcuts should
+    render its rows.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    analyze_content = json.loads(analyze.read_text())
+    formatter = BaseFormatter()
+
+    report = formatter.build_report(analyze)
+
+    assert isinstance(report, ReportModel)
+    assert formatter.build_report(report) is report
+    assert formatter.build_analyzed_table(analyze_content) == report.analyzed
+    assert formatter.build_errors_table(analyze_content) == report.failures
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_base_report_many_formats(settings):
+    """
+    Every formatter should render the same output from a report model than from
+    the analyze.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    report = BaseFormatter().build_report(analyze)
+
+    for klass in [CSVFormatter, JSONFormatter, RestructuredTextFormatter]:
+        from_report = []
+        from_analyze = []
+
+        klass(printer=from_report.append).print(report)
+        klass(printer=from_analyze.append).print(analyze)
+
+        assert from_report == from_analyze
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_base_memoized_dates(settings):
+    """
+    Parsed dates and humanized deltas should be computed only once for each
+    distinct date and still produce the same rows.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    analyze_content = json.loads(analyze.read_text())
+    analyzed = [item for item in analyze_content if item["status"] == "analyzed"]
+    formatter = BaseFormatter()
+
+    # Rows from repeated requirements are identical
+    rows = formatter.build_report(analyzed + analyzed).analyzed
+    size = len(analyzed)
+    assert [dict(row, key=None) for row in rows[:size]] == [
+        dict(row, key=None) for row in rows[size:]
+    ]
+
+    dates = set()
+    for item in analyzed:
+        dates.add(item["highest_published"])
+        if item["resolved_version"]:
+            dates.add(item["resolved_published"])
+
+    assert set(formatter.date_cache.keys()) == dates
+    assert set(formatter.delta_cache.keys()) == set([
+        (value, formatter.now_date) for value in dates
+    ])
+    assert formatter.humanize_delta("2024-05-25T10:00:00Z") == "2 months"
+
+
+@pytest.mark.parametrize("options, expected", [
+    (
+        {},
+        [
+            "django", "Pillow", "djangorestframework", "django-admin-shortcuts",
+            "requests", "urllib3",
+        ],
+    ),
+    (
+        {"sort": "lateness"},
+        [
+            "django", "requests", "Pillow", "django-admin-shortcuts",
+            "djangorestframework", "urllib3",
+        ],
+    ),
+    ({"sort": "lateness", "top": 3}, ["django", "requests", "Pillow"]),
+    ({"sort": "name", "top": 2}, ["django", "django-admin-shortcuts"]),
+    ({"top": 2}, ["django", "Pillow"]),
+    (
+        {"min_lateness": 6},
+        ["django", "Pillow", "django-admin-shortcuts", "requests"],
+    ),
+    (
+        {"sort": "days_behind", "top": 2, "min_lateness": 50},
+        ["requests", "django"],
+    ),
+])
+def test_base_build_report_selection(settings, options, expected):
+    """
+    Sort, top and lateness filter should be applied on analyzed requirements only
+    and row keys should follow the selection order.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    report = BaseFormatter(**options).build_report(analyze)
+
+    assert [row["name"] for row in report.analyzed] == expected
+    assert [row["key"] for row in report.analyzed] == list(
+        range(1, len(expected) + 1)
+    )
+    assert [row["key"] for row in report.failures] == [1, 2]
+
+
+def test_base_invalid_selection():
+    """
+    An unknown sort field or a negative top should raise an error.
+    """
+    with pytest.raises(ValueError):
+        BaseFormatter(sort="nope")
+
+    with pytest.raises(ValueError):
+        BaseFormatter(top=-1)
@@ -225,3 +225,97 @@ def test_rst_write_without_failures(settings, tmp_path):
     formatter = RestructuredTextFormatter()
     formatter.write(analyze, destination=destination, with_failures=False)
     assert destination.read_text() == formatted.read_text()
+
+
+def test_rst_grid_multiline_cells():
+    """
+    Grid table should align every line from multiline cells and fill missing lines.
+    """
+    formatter = RestructuredTextFormatter()
+
+    output = "".join(formatter.iter_grid(
+        ["#", "Name"],
+        [[1, " foo\nbarbaz "], [2, None]],
+        ["left", "center"],
+    ))
+
+    assert output == (
+        "+-----+--------+\n"
+        "| #   |  Name  |\n"
+        "+=====+========+\n"
+        "| 1   |  foo   |\n"
+        "|     | barbaz |\n"
+        "+-----+--------+\n"
+        "| 2   |        |\n"
+        "+-----+--------+"
+    )
+
+
+def test_rst_grid_empty():
+    """
+    Grid table without any row should only have its headers.
+    """
+    formatter = RestructuredTextFormatter()
+
+    assert formatter.render_analyzed([]) == (
+        "Analyzed\n"
+        "********\n"
+        "+-----+--------+------------+------------+------------------+\n"
+        "| #   | Name   |  Lateness  |   Required |   Latest release |\n"
+        "+=====+========+============+============+==================+"
+    )
+    assert formatter.render_errors([]) == ""
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_rst_write_with_failures(settings, tmp_path):
+    """
+    Tables should be streamed to the file with the same content than the rendered
+    tables.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    destination = tmp_path / "output.rst"
+    formatter = RestructuredTextFormatter()
+    report = formatter.build_report(analyze)
+
+    formatter.write(report, destination)
+
+    assert destination.read_text() == (
+        formatter.render_analyzed(report.analyzed) +
+        formatter.render_errors(report.failures)
+    )
+
+
+def test_rst_grid_wide_characters():
+    """
+    Grid table should be sized on display width so wide characters do not break the
+    grid.
+    """
+    formatter = RestructuredTextFormatter()
+
+    output = formatter.render_errors([
+        {
+            "key": 1,
+            "source": "日本語",
+            "status": "invalid",
+            "resume": "x",
+        },
+        {
+            "key": 2,
+            "source": "-~@élé",
+            "status": "invalid",
+            "resume": None,
+        },
+    ])
+
+    assert output == (
+        "\nFailures\n"
+        "********\n"
+        "+-----+----------+----------+----------+\n"
+        "| #   | Source   |  Status  | Resume   |\n"
+        "+=====+==========+==========+==========+\n"
+        "| 1   | 日本語   | invalid  | x        |\n"
+        "+-----+----------+----------+----------+\n"
+        "| 2   | -~@élé   | invalid  |          |\n"
+        "+-----+----------+----------+----------+"
+    )
@@ -69,3 +69,48 @@ def test_rich_write_with_failures(settings, tmp_path):
     formatter.write(analyze, destination=destination, with_failures=True)
 
     assert destination.read_text() == formatted.read_text()
+
+
+@rich_available
+@freeze_time("2024-07-25 10:00:00")
+def test_rich_print_pages(settings):
+    """
+    With a page size, tables should be split into panels with the page number in
+    their title.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    formatter = RichFormatter(page_size=4)
+    report = formatter.build_report(analyze)
+
+    assert [
+        (page, total, [row["key"] for row in rows])
+        for page, total, rows in formatter.iter_pages(report.analyzed)
+    ] == [(1, 2, [1, 2, 3, 4]), (2, 2, [5, 6])]
+
+    console = formatter.print(report, destination=StringIO(), with_failures=True)
+    output = console.file.getvalue()
+
+    assert "Analyzed (1/2)" in output
+    assert "Analyzed (2/2)" in output
+    # Failures fit in a single page so there is no page number
+    assert "Failures ─" in output
+    assert "django-admin-shortcuts" in output.split("Analyzed (2/2)")[0]
+    assert "urllib3" in output.split("Analyzed (2/2)")[1]
+
+
+@rich_available
+@freeze_time("2024-07-25 10:00:00")
+@pytest.mark.parametrize("page_size", [50, -2])
+def test_rich_print_pages_unsplit(settings, page_size):
+    """
+    When there is less rows than page size or with a negative page size the output
+    should be the same than without pages.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_with_failures.rich"
+
+    formatter = RichFormatter(page_size=page_size)
+
+    console = formatter.print(analyze, destination=StringIO(), with_failures=True)
+    assert console.file.getvalue() == formatted.read_text()
@@ -57,3 +57,69 @@ def test_csv_write_with_failures(settings, tmp_path):
     formatter.write(analyze, destination=destination, with_failures=True)
 
     assert destination.read_text() == formatted.read_text()
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_csv_write_without_failures(settings, tmp_path):
+    """
+    CSV writer method should only write analyzed rows in given destination file.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_without_failures.csv"
+    destination = tmp_path / "output.csv"
+
+    formatter = CSVFormatter()
+    formatter.write(analyze, destination=destination, with_failures=False)
+
+    assert destination.read_text() == formatted.read_text()
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_csv_print_stream(settings, capsys):
+    """
+    With default printer, rows should be written directly to the standard output
+    with the same content than with ``click.echo``.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_with_failures.csv"
+
+    formatter = CSVFormatter()
+    report = formatter.build_report(analyze)
+    formatter.print(report, with_failures=True)
+
+    assert capsys.readouterr().out == (
+        formatter.render_analyzed(report.analyzed) + "\n" +
+        formatter.render_errors(report.failures) + "\n"
+    )
+    assert capsys.readouterr().out == ""
+    assert (
+        formatter.render_analyzed(report.analyzed) +
+        formatter.render_errors(report.failures)
+    ) == formatted.read_text()
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_csv_stream_report(settings, tmp_path):
+    """
+    Without sort and top options, analyzed rows should be lazily built while
+    failures are collected, else the report is fully built first.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    formatter = CSVFormatter()
+
+    report, rows = formatter.stream_report(analyze)
+    assert report.failures == []
+    assert [row["key"] for row in rows] == [1, 2, 3, 4, 5, 6]
+    assert [row["key"] for row in report.failures] == [1, 2]
+
+    report, rows = CSVFormatter(sort="lateness").stream_report(analyze)
+    assert rows is report.analyzed
+    assert len(report.failures) == 2
+
+    # Streamed output is the same than from a built report
+    streamed = formatter.write(analyze, tmp_path / "streamed.csv")
+    built = formatter.write(
+        formatter.build_report(analyze),
+        tmp_path / "built.csv",
+    )
+    assert streamed.read_text() == built.read_text()
@@ -168,3 +168,179 @@ def test_analyze_with_env(caplog, settings):
     ]
     # No logs since they are muted to have clear output
     assert caplog.record_tuples == []
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_analyze_with_matrix(caplog, settings, tmp_path):
+    """
+    Command should add the environment matrix to each requirement when environment
+    files are given.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps({"python_version": "2.6"}))
+    modern = tmp_path / "modern.json"
+    modern.write_text(json.dumps({"python_version": "3.12"}))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            "-",
+            "--cachedir", str(cachedir),
+            "--matrix", str(legacy),
+            "--matrix", str(modern),
+        ],
+        input="django==3.2.1 ; python_version >= \"3.0\"\ndiskette",
+    )
+    assert result.exit_code == 0
+
+    results = json.loads(result.output)
+    assert [(v["name"], v["status"], v["environments"]) for v in results] == [
+        (
+            "django",
+            "analyzed",
+            {
+                "legacy": {"status": "marker-reject", "lateness": None},
+                "modern": {"status": "analyzed", "lateness": 79},
+            },
+        ),
+        (
+            "diskette",
+            "analyzed",
+            {
+                "legacy": {"status": "analyzed", "lateness": None},
+                "modern": {"status": "analyzed", "lateness": None},
+            },
+        ),
+    ]
+    assert caplog.record_tuples == []
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_analyze_ndjson(caplog, settings, tmp_path):
+    """
+    Command should output a JSON object per line for each requirement either to
+    standard output or to a file.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    destination = tmp_path / "analyze.ndjson"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            "-",
+            "--cachedir", str(cachedir),
+            "--ndjson",
+        ],
+        input="django==3.2.1\n-e .\ndiskette",
+    )
+    assert result.exit_code == 0
+
+    lines = result.output.splitlines()
+    assert [json.loads(line)["source"] for line in lines] == [
+        "django==3.2.1",
+        "-e .",
+        "diskette",
+    ]
+    assert caplog.record_tuples == []
+
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            "-",
+            "--cachedir", str(cachedir),
+            "--ndjson",
+            "--destination", str(destination),
+        ],
+        input="django==3.2.1\ndiskette",
+    )
+    assert result.exit_code == 0
+
+    assert [
+        json.loads(line)["name"]
+        for line in destination.read_text().splitlines()
+    ] == ["django", "diskette"]
+
+
+def test_analyze_fast_json(caplog, settings):
+    """
+    Command should output the same data with fast JSON serialization.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+
+    runner = CliRunner()
+    arguments = ["analyze", "-", "--cachedir", str(cachedir)]
+
+    result = runner.invoke(cli_frontend, arguments, input="django==3.2.1\n-e .")
+    assert result.exit_code == 0
+
+    fast_result = runner.invoke(
+        cli_frontend,
+        ["--fast-json"] + arguments,
+        input="django==3.2.1\n-e .",
+    )
+    assert fast_result.exit_code == 0
+
+    assert json.loads(fast_result.output) == json.loads(result.output)
+
+
+def test_analyze_matrix_with_env(caplog, settings, tmp_path):
+    """
+    Command should refuse an environment with a matrix since rejected requirements
+    would never be analyzed for matrix environments.
+    """
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps({"python_version": "2.7"}))
+    modern = tmp_path / "modern.json"
+    modern.write_text(json.dumps({"python_version": "3.11"}))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            "-",
+            "--env", str(legacy),
+            "--matrix", str(legacy),
+            "--matrix", str(modern),
+        ],
+        input="django ; python_version >= \"3.0\"",
+    )
+
+    assert result.exit_code == 2
+    assert "Error: Options '--env' and '--matrix' are exclusive." in result.output
+
+
+def test_analyze_matrix_duplicate_names(caplog, settings, tmp_path):
+    """
+    Command should refuse matrix environment files with the same name since their
+    results would be indexed on the same name.
+    """
+    legacy = tmp_path / "a" / "py.json"
+    legacy.parent.mkdir()
+    legacy.write_text(json.dumps({"python_version": "2.7"}))
+    modern = tmp_path / "b" / "py.json"
+    modern.parent.mkdir()
+    modern.write_text(json.dumps({"python_version": "3.11"}))
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            "-",
+            "--matrix", str(legacy),
+            "--matrix", str(modern),
+        ],
+        input="django ; python_version >= \"3.0\"",
+    )
+
+    assert result.exit_code == 2
+    assert "Error: Matrix environment name 'py' is given multiple times." in (
+        result.output
+    )
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from freezegun import freeze_time
 
 from click.testing import CliRunner
@@ -92,3 +96,180 @@ def test_format_without_failures_to_file(caplog, tmp_path, settings):
     assert caplog.record_tuples == [
         ("dependency-comb", 20, "Formatted analyze to: {}".format(destination)),
     ]
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_format_from_ndjson(caplog, settings):
+    """
+    Command should accept NDJSON analyze and give the same output than from a JSON
+    list.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_with_failures.rst"
+    ndjson = "\n".join([
+        json.dumps(item)
+        for item in json.loads(analyze.read_text())
+    ])
+
+    runner = CliRunner()
+    result = runner.invoke(cli_frontend, ["format", "-"], input=ndjson)
+
+    assert result.exit_code == 0
+    assert caplog.record_tuples == []
+    assert result.output == formatted.read_text() + "\n"
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_format_rich_pages(caplog, settings):
+    """
+    Command should split Rich tables into pages and ignore page size for other
+    formats.
+    """
+    pytest.importorskip("rich")
+
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_with_failures.rst"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        ["format", str(analyze), "--format", "rich", "--page-size", "3"],
+    )
+
+    assert result.exit_code == 0
+    assert "Analyzed (1/2)" in result.output
+    assert "Analyzed (2/2)" in result.output
+
+    result = runner.invoke(cli_frontend, ["format", str(analyze), "--page-size", "3"])
+
+    assert result.exit_code == 0
+    assert result.output == formatted.read_text() + "\n"
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_format_from_msgpack(caplog, settings, tmp_path):
+    """
+    Command should detect a MessagePack manifest from 'analyze' command and format
+    it like from JSON.
+    """
+    pytest.importorskip("msgpack")
+
+    cachedir = settings.fixtures_path / "api_cache"
+    requirements_file = settings.fixtures_path / "pip_syntax/requirements.txt"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_with_failures.rst"
+    manifest = tmp_path / "analyze.msgpack"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            str(requirements_file),
+            "--cachedir", str(cachedir),
+            "--msgpack",
+            "--destination", str(manifest),
+        ],
+    )
+    assert result.exit_code == 0
+
+    result = runner.invoke(cli_frontend, ["format", str(manifest)])
+    assert result.exit_code == 0
+    assert result.output == formatted.read_text() + "\n"
+
+    result = runner.invoke(
+        cli_frontend,
+        ["format", "-"],
+        input=manifest.read_bytes(),
+    )
+    assert result.exit_code == 0
+    assert result.output == formatted.read_text() + "\n"
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_format_lateness_summary(caplog, settings):
+    """
+    Command should format an analyze with lateness summaries like a full analyze.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    requirements_file = settings.fixtures_path / "pip_syntax/requirements.txt"
+    formatted = settings.fixtures_path / "pip_syntax/formatted_with_failures.rst"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "analyze",
+            str(requirements_file),
+            "--cachedir", str(cachedir),
+            "--lateness-summary",
+        ],
+    )
+    assert result.exit_code == 0
+
+    analyze = json.loads(result.output)
+    assert analyze[0]["lateness"]["count"] == 187
+
+    result = runner.invoke(cli_frontend, ["format", "-"], input=result.output)
+    assert result.exit_code == 0
+    assert result.output == formatted.read_text() + "\n"
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_format_selection(caplog, settings):
+    """
+    Command should only format the selected analyzed requirements.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "format", str(analyze),
+            "--format", "json",
+            "--sort", "lateness",
+            "--top", "2",
+            "--min-lateness", "10",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert caplog.record_tuples == []
+
+    output = json.loads(result.output)
+    assert [(row["key"], row["name"]) for row in output["analyzed"]] == [
+        (1, "django"),
+        (2, "requests"),
+    ]
+    assert len(output["failures"]) == 2
+
+
+@pytest.mark.parametrize("option", ["--top", "--min-lateness"])
+def test_format_selection_negative(caplog, settings, option):
+    """
+    Command should refuse negative selection values.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    runner = CliRunner()
+    result = runner.invoke(cli_frontend, ["format", str(analyze), option, "-1"])
+
+    assert result.exit_code == 2
+    assert "-1 is not in the range x>=0" in result.output
+
+
+def test_format_negative_page_size(caplog, settings):
+    """
+    Command should refuse a negative page size whatever is the format, so it does
+    not depend on the optional Rich formatter.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        ["format", str(analyze), "--format", "rst", "--page-size", "-2"],
+    )
+
+    assert result.exit_code == 2
+    assert "-2 is not in the range x>=0" in result.output
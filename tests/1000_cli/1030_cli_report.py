@@ -1,3 +1,5 @@
+import json
+
 from freezegun import freeze_time
 
 from click.testing import CliRunner
@@ -118,3 +120,110 @@ def test_report_to_file(caplog, tmp_path, settings):
         (__pkgname__, 20, "Processing package: urllib3"),
         (__pkgname__, 20, "Analyze report written to: {}".format(destination)),
     ]
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_report_many_formats(caplog, tmp_path, settings):
+    """
+    Command should write every given format to its destination from a single
+    analyze.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    requirements_file = settings.fixtures_path / "pip_syntax/requirements.txt"
+
+    formats = ["rst", "csv", "json"]
+    destinations = [tmp_path / "format.{}".format(name) for name in formats]
+
+    arguments = ["report", "-", "--no-failures", "--cachedir", str(cachedir)]
+    for name, destination in zip(formats, destinations):
+        arguments.extend(["--format", name, "--destination", str(destination)])
+
+    runner = CliRunner()
+    result = runner.invoke(cli_frontend, arguments, input=requirements_file.read_text())
+
+    assert result.exit_code == 0
+
+    for name, destination in zip(formats, destinations):
+        expected = settings.fixtures_path / (
+            "pip_syntax/formatted_without_failures.{}".format(name)
+        )
+        if name == "json":
+            # JSON fixture is indented
+            assert json.loads(destination.read_text()) == json.loads(
+                expected.read_text()
+            )
+        else:
+            assert destination.read_text() == expected.read_text()
+
+    # Packages are processed only once for all formats
+    processed = [
+        item for item in caplog.record_tuples
+        if item[2].startswith("Processing package:")
+    ]
+    assert len(processed) == 6
+
+    assert caplog.record_tuples[-3:] == [
+        (__pkgname__, 20, "Analyze report written to: {}".format(path))
+        for path in destinations
+    ]
+
+
+def test_report_many_formats_missing_destination(caplog, tmp_path, settings):
+    """
+    Command should fail when there is not a destination for each format.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    requirements_file = settings.fixtures_path / "pip_syntax/requirements.txt"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "report",
+            str(requirements_file),
+            "--cachedir",
+            str(cachedir),
+            "--format",
+            "rst",
+            "--format",
+            "csv",
+            "--destination",
+            str(tmp_path / "format.rst"),
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert "There must be a destination for each format." in result.output
+    assert not (tmp_path / "format.rst").exists()
+
+
+def test_report_selection(caplog, tmp_path, settings):
+    """
+    Command should only report the selected analyzed requirements for every format.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    requirements_file = settings.fixtures_path / "pip_syntax/requirements.txt"
+    destination = tmp_path / "report.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "report", "-",
+            "--cachedir", str(cachedir),
+            "--format", "json",
+            "--destination", str(destination),
+            "--sort", "days_behind",
+            "--top", "2",
+        ],
+        input=requirements_file.read_text(),
+    )
+
+    assert result.exit_code == 0
+
+    output = json.loads(destination.read_text())
+    assert [row["name"] for row in output["analyzed"]] == [
+        "django-admin-shortcuts",
+        "requests",
+    ]
+    assert len(output["failures"]) == 2
@@ -0,0 +1,181 @@
+import json
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from click.testing import CliRunner
+
+from dependency_comb import __pkgname__
+from dependency_comb.cli.batch import get_manifest_filename
+from dependency_comb.cli.entrypoint import cli_frontend
+
+
+def test_get_manifest_filename():
+    """
+    Manifest filename should be built from the source path parts.
+    """
+    assert get_manifest_filename(Path("requirements.txt")) == "requirements.json"
+    assert get_manifest_filename(Path("foo/requirements/base.txt")) == (
+        "foo-requirements-base.json"
+    )
+    assert get_manifest_filename(Path("/foo/bar.txt")) == "foo-bar.json"
+
+    # Used filenames get a numbered suffix
+    used = set()
+    assert get_manifest_filename(Path("a-b/c.txt"), used=used) == "a-b-c.json"
+    assert get_manifest_filename(Path("a/b-c.txt"), used=used) == "a-b-c-2.json"
+    assert get_manifest_filename(Path("a/b/c.txt"), used=used) == "a-b-c-3.json"
+    assert used == {"a-b-c.json", "a-b-c-2.json", "a-b-c-3.json"}
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_batch_to_stdout(caplog, settings):
+    """
+    Command should output the aggregated manifest indexed on sources, directories are
+    expanded to their requirement files.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    requirements_file = settings.fixtures_path / "pip_syntax/requirements.txt"
+    nested_dir = settings.fixtures_path / "nested_requirements"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "batch",
+            str(requirements_file),
+            str(nested_dir),
+            "--pattern", "b*.txt",
+            "--cachedir", str(cachedir),
+            "--pause", "0",
+        ],
+    )
+    assert result.exit_code == 0
+
+    results = json.loads(result.output)
+    assert list(results.keys()) == [
+        str(requirements_file),
+        str(nested_dir / "base.txt"),
+        str(nested_dir / "build.txt"),
+    ]
+    assert [v["name"] for v in results[str(nested_dir / "base.txt")]] == [
+        "django",
+        "diskette",
+        "boussole",
+        "django-admin-shortcuts",
+    ]
+    assert [v["status"] for v in results[str(nested_dir / "build.txt")]] == [
+        "analyzed",
+    ]
+    assert caplog.record_tuples == []
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_batch_to_directory(caplog, monkeypatch, settings, tmp_path):
+    """
+    Command should write a manifest for each source, the aggregated manifest and
+    the ages.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    first = tmp_path / "first" / "requirements.txt"
+    first.parent.mkdir()
+    first.write_text("django==3.2.1\ndiskette\n")
+    second = tmp_path / "second" / "requirements.txt"
+    second.parent.mkdir()
+    second.write_text("diskette\n")
+    destination = tmp_path / "output"
+
+    # Use relative source paths from the temporary directory
+    monkeypatch.chdir(tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "batch",
+            "first/requirements.txt",
+            "second/requirements.txt",
+            "--cachedir", str(cachedir),
+            "--destination", str(destination),
+        ],
+    )
+    assert result.exit_code == 0
+
+    assert sorted([item.name for item in destination.iterdir()]) == [
+        "ages.json",
+        "manifest.json",
+        "sources",
+    ]
+    assert sorted([item.name for item in (destination / "sources").iterdir()]) == [
+        "first-requirements.json",
+        "second-requirements.json",
+    ]
+    manifest = json.loads(
+        (destination / "sources" / "first-requirements.json").read_text()
+    )
+    assert [v["name"] for v in manifest] == ["django", "diskette"]
+
+    aggregated = json.loads((destination / "manifest.json").read_text())
+    assert list(aggregated.keys()) == [
+        "first/requirements.txt",
+        "second/requirements.txt",
+    ]
+
+    # Unpinned requirements have no age metrics
+    ages = json.loads((destination / "ages.json").read_text())
+    assert ages == {
+        "first/requirements.txt": {
+            "packages": 1,
+            "days_behind": 1253,
+            "libyear": 3.43,
+        },
+        "second/requirements.txt": {
+            "packages": 0,
+            "days_behind": 0,
+            "libyear": 0.0,
+        },
+    }
+
+    assert caplog.record_tuples[:3] == [
+        (__pkgname__, 20, "Fetch plan for 2 source(s): 2 package(s)"),
+        (__pkgname__, 20, "Processing package: django"),
+        (__pkgname__, 20, "Processing package: diskette"),
+    ]
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_batch_manifest_collisions(caplog, monkeypatch, settings, tmp_path):
+    """
+    Sources with the same flattened filename should not overwrite each other and
+    they can not overwrite the aggregated files.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    sources = ["a-b/c.txt", "a/b-c.txt", "manifest.txt"]
+    for source in sources:
+        path = tmp_path / source
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("diskette\n")
+    destination = tmp_path / "output"
+
+    monkeypatch.chdir(tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        ["batch", "--cachedir", str(cachedir), "--destination", str(destination)]
+        + sources,
+    )
+    assert result.exit_code == 0
+
+    assert sorted([item.name for item in (destination / "sources").iterdir()]) == [
+        "a-b-c-2.json",
+        "a-b-c.json",
+        "manifest.json",
+    ]
+    assert list(json.loads((destination / "manifest.json").read_text())) == sources
+    assert (
+        "dependency-comb",
+        30,
+        "Manifest filename for 'a/b-c.txt' is already used, renamed to: "
+        "a-b-c-2.json",
+    ) in caplog.record_tuples
@@ -0,0 +1,60 @@
+import json
+
+from freezegun import freeze_time
+
+from click.testing import CliRunner
+
+from dependency_comb.cli.entrypoint import cli_frontend
+
+
+@freeze_time("2024-07-25 10:00:00")
+def test_scan(caplog, settings, tmp_path):
+    """
+    Command should analyze all found requirement files and resolve their inclusions
+    from their own directory.
+    """
+    cachedir = settings.fixtures_path / "api_cache"
+    (tmp_path / "requirements.txt").write_text("django==3.2.1\n")
+    (tmp_path / "project" / "requirements").mkdir(parents=True)
+    (tmp_path / "project" / "requirements" / "base.txt").write_text(
+        "diskette\n-r dev.txt\n"
+    )
+    (tmp_path / "project" / "requirements" / "dev.txt").write_text(
+        "boussole<=2.1.2\n"
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "scan",
+            str(tmp_path),
+            "--cachedir", str(cachedir),
+            "--pause", "0",
+        ],
+    )
+    assert result.exit_code == 0
+
+    results = json.loads(result.output)
+    assert {k: [v["name"] for v in items] for k, items in results.items()} == {
+        "project/requirements/base.txt": ["diskette", "boussole"],
+        "project/requirements/dev.txt": ["boussole"],
+        "requirements.txt": ["django"],
+    }
+    assert caplog.record_tuples == []
+
+
+def test_scan_invalid_workers(caplog, tmp_path):
+    """
+    Command should refuse an amount of workers lower than one.
+    """
+    runner = CliRunner()
+
+    for value in ["0", "-1"]:
+        result = runner.invoke(
+            cli_frontend,
+            ["scan", str(tmp_path), "--workers", value],
+        )
+
+        assert result.exit_code == 2
+        assert "{} is not in the range x>=1".format(value) in result.output
@@ -0,0 +1,97 @@
+import json
+
+from click.testing import CliRunner
+
+from dependency_comb.cli.entrypoint import cli_frontend
+
+
+def test_stats_required_sources(caplog):
+    """
+    Command should fail without any source.
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli_frontend, ["stats"])
+
+    assert result.exit_code == 2
+    assert "Error: Missing argument 'SOURCES'." in result.output
+    assert caplog.record_tuples == []
+
+
+def test_stats_output(caplog, settings):
+    """
+    Command should output statistics as JSON to standard output.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        ["stats", str(analyze), "--top", "1", "--percentile", "50"],
+    )
+
+    assert result.exit_code == 0
+    assert caplog.record_tuples == []
+
+    output = json.loads(result.output)
+    assert output["projects"] == 1
+    assert output["requirements"] == 6
+    assert output["ignored"] == 2
+    assert output["percentiles"] == {
+        "lateness": {"50": 6.0},
+        "days_behind": {"50": 1464.0},
+    }
+    assert output["top"]["lateness"] == [
+        {
+            "name": "django",
+            "project": str(analyze),
+            "version": "1.11.9",
+            "lateness": 187,
+        },
+    ]
+    assert output["pins"]["urllib3"] == {"latest": 1}
+
+
+def test_stats_destination(caplog, settings, tmp_path):
+    """
+    Command should write statistics to destination file.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+    aggregated = tmp_path / "manifest.json"
+    aggregated.write_text(json.dumps({"a": json.loads(analyze.read_text())}))
+    destination = tmp_path / "stats.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_frontend,
+        [
+            "stats", str(analyze), str(aggregated),
+            "--destination", str(destination),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert caplog.record_tuples == [
+        (
+            "dependency-comb",
+            20,
+            "Statistics written to: {}".format(destination),
+        ),
+    ]
+
+    output = json.loads(destination.read_text())
+    assert output["projects"] == 2
+    assert output["requirements"] == 12
+    assert list(output["percentiles"]["lateness"].keys()) == ["50", "90", "99"]
+
+
+def test_stats_negative_top(caplog, settings):
+    """
+    Command should refuse a negative top size.
+    """
+    analyze = settings.fixtures_path / "pip_syntax/analyzed.json"
+
+    runner = CliRunner()
+    result = runner.invoke(cli_frontend, ["stats", str(analyze), "--top", "-1"])
+
+    assert result.exit_code == 2
+    assert "-1 is not in the range x>=0" in result.output